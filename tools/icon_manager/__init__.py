@@ -11,10 +11,17 @@ Usage:
 
 from .core import COLORS, Theme, PROJECT_ROOT, CONFIG_PATH, IconBounds, IconTarget, Config
 from .rendering import (
+    cached_checkerboard,
+    cached_checkerboard_image,
     create_checkerboard,
+    create_checkerboard_image,
     get_image_bounds,
     get_svg_content_bounds,
     load_icon_preview,
+    load_icon_preview_image,
+    load_svg_source,
+    prescale_fast,
+    preview_cache_key,
     render_png_to_bounds,
     render_svg_to_size,
     render_svg_cropped,
@@ -26,8 +33,8 @@ __all__ = [
     'COLORS', 'Theme', 'PROJECT_ROOT', 'CONFIG_PATH',
     'IconBounds', 'IconTarget', 'Config',
     # Rendering
-    'create_checkerboard', 'get_image_bounds', 'get_svg_content_bounds',
-    'load_icon_preview', 'render_png_to_bounds', 'render_svg_to_size', 'render_svg_cropped',
+    'cached_checkerboard', 'cached_checkerboard_image', 'create_checkerboard', 'create_checkerboard_image', 'get_image_bounds', 'get_svg_content_bounds',
+    'load_icon_preview', 'load_icon_preview_image', 'load_svg_source', 'prescale_fast', 'preview_cache_key', 'render_png_to_bounds', 'render_svg_to_size', 'render_svg_cropped',
     # UI
     'IconPreviewLabel', 'ComparisonWidget', 'SvgInputWidget', 'IconManagerWindow',
 ]
@@ -1,23 +1,25 @@
 """Core data structures and constants."""
 
 from .constants import (
-    COLORS, Theme, PROJECT_ROOT, CONFIG_PATH, TOOLS_DIR,
+    COLORS, Theme, PROJECT_ROOT, CONFIG_PATH, BOUNDS_CACHE_PATH, RENDER_HASH_CACHE_PATH, TOOLS_DIR,
     ANDROID_RES_DIR, IOS_ASSETS_DIR, ASSETS_ANDROID_DIR, ASSETS_IOS_DIR,
     MIPMAP_SIZES, ADAPTIVE_ICON_SIZES,
     ANDROID_ICON_FILES, ANDROID_LEGACY_ICONS, ANDROID_ADAPTIVE_ICONS,
 )
-from .models import IconBounds, IconTarget, Config
+from .models import IconBounds, IconTarget, Config, BoundsCache, RenderHashCache
 from .adaptive_icons import (
     replace_layer, replace_layer_from_svg, replace_layer_with_overrides,
-    get_layer_targets, get_layer_preview, get_layer_sizes, LayerType,
+    get_layer_targets, get_layer_targets_map, get_layer_preview, get_layer_sizes,
+    invalidate_layer_cache, LayerType,
 )
 
 __all__ = [
-    'COLORS', 'Theme', 'PROJECT_ROOT', 'CONFIG_PATH', 'TOOLS_DIR',
+    'COLORS', 'Theme', 'PROJECT_ROOT', 'CONFIG_PATH', 'BOUNDS_CACHE_PATH', 'RENDER_HASH_CACHE_PATH', 'TOOLS_DIR',
     'ANDROID_RES_DIR', 'IOS_ASSETS_DIR', 'ASSETS_ANDROID_DIR', 'ASSETS_IOS_DIR',
     'MIPMAP_SIZES', 'ADAPTIVE_ICON_SIZES',
     'ANDROID_ICON_FILES', 'ANDROID_LEGACY_ICONS', 'ANDROID_ADAPTIVE_ICONS',
-    'IconBounds', 'IconTarget', 'Config',
+    'IconBounds', 'IconTarget', 'Config', 'BoundsCache', 'RenderHashCache',
     'replace_layer', 'replace_layer_from_svg', 'replace_layer_with_overrides',
-    'get_layer_targets', 'get_layer_preview', 'get_layer_sizes', 'LayerType',
+    'get_layer_targets', 'get_layer_targets_map', 'get_layer_preview', 'get_layer_sizes',
+    'invalidate_layer_cache', 'LayerType',
 ]
@@ -6,8 +6,10 @@ for adaptive icon foreground and background layers, and notification icons.
 Also supports SVG sources with automatic rendering to PNG at each density.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
 from PyQt6.QtCore import Qt, QByteArray, QRectF
 from PyQt6.QtGui import QImage, QPainter
@@ -18,6 +20,12 @@ from .constants import ADAPTIVE_ICON_SIZES, MIPMAP_SIZES, ANDROID_RES_DIR, ASSET
 
 LayerType = Literal["foreground", "background", "notification"]
 
+# Called with the number of targets processed so far
+ProgressCallback = Callable[[int], None]
+
+# Polled before each target; returning True stops the replacement early
+CancelCallback = Callable[[], bool]
+
 
 def get_layer_filename(layer: LayerType) -> str:
     """Get the filename for an adaptive icon layer or notification icon."""
@@ -38,29 +46,77 @@ def get_target_directories() -> list[Path]:
     return [ANDROID_RES_DIR, ASSETS_ANDROID_DIR]
 
 
-def get_layer_targets(layer: LayerType) -> list[tuple[Path, int]]:
+@lru_cache(maxsize=1)
+def _existing_subdirectories() -> dict[Path, frozenset[str]]:
+    """
+    List the subdirectories of each target directory.
+
+    One os.scandir per target directory, shared by every layer type.
+    Missing target directories are left out.
+    """
+    found = {}
+    for base_dir in get_target_directories():
+        try:
+            with os.scandir(base_dir) as entries:
+                found[base_dir] = frozenset(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            continue
+    return found
+
+
+@lru_cache(maxsize=8)
+def get_layer_targets(layer: LayerType) -> tuple[tuple[Path, int], ...]:
     """
     Get all target paths and sizes for a layer type.
 
+    The result is cached per layer; call invalidate_layer_cache() after the
+    mipmap directories may have changed.
+
     Returns:
-        List of (path, size) tuples for each mipmap density.
+        Tuple of (path, size) pairs for each mipmap density.
     """
     filename = get_layer_filename(layer)
     sizes = get_layer_sizes(layer)
+    subdirs = _existing_subdirectories()
     targets = []
 
     for base_dir in get_target_directories():
-        if not base_dir.exists():
+        if base_dir not in subdirs:
             continue
         for mipmap_dir, size in sizes.items():
-            target_path = base_dir / mipmap_dir / filename
-            if target_path.parent.exists():
-                targets.append((target_path, size))
+            if mipmap_dir in subdirs[base_dir]:
+                targets.append((base_dir / mipmap_dir / filename, size))
+
+    return tuple(targets)
 
-    return targets
 
+@lru_cache(maxsize=8)
+def get_layer_targets_map(layer: LayerType) -> dict[str, Path]:
+    """
+    Get the target path for each density of a layer type.
+
+    When a density exists in several target directories, the last one wins.
+    The returned dict is cached and shared; do not modify it.
 
-def replace_layer(source_path: Path, layer: LayerType) -> tuple[int, list[str]]:
+    Returns:
+        Dict mapping density names (e.g., "mipmap-xxhdpi") to target paths.
+    """
+    return {path.parent.name: path for path, _ in get_layer_targets(layer)}
+
+
+def invalidate_layer_cache() -> None:
+    """Forget cached layer targets so the next lookup rescans the directories."""
+    _existing_subdirectories.cache_clear()
+    get_layer_targets.cache_clear()
+    get_layer_targets_map.cache_clear()
+
+
+def replace_layer(
+    source_path: Path,
+    layer: LayerType,
+    progress: ProgressCallback | None = None,
+    is_cancelled: CancelCallback | None = None
+) -> tuple[int, list[str]]:
     """
     Replace an adaptive icon layer across all mipmap densities.
 
@@ -69,6 +125,9 @@ def replace_layer(source_path: Path, layer: LayerType) -> tuple[int, list[str]]:
     Args:
         source_path: Path to the source PNG file.
         layer: Either "foreground" or "background".
+        progress: Optional callback receiving the number of targets processed.
+        is_cancelled: Optional callback; when it returns True, remaining
+            targets are skipped.
 
     Returns:
         Tuple of (success_count, error_messages).
@@ -84,7 +143,9 @@ def replace_layer(source_path: Path, layer: LayerType) -> tuple[int, list[str]]:
     success = 0
     errors = []
 
-    for target_path, size in targets:
+    for done, (target_path, size) in enumerate(targets, 1):
+        if is_cancelled and is_cancelled():
+            break
         try:
             # Scale to target size
             scaled = source.scaled(
@@ -103,6 +164,9 @@ def replace_layer(source_path: Path, layer: LayerType) -> tuple[int, list[str]]:
                 errors.append(f"Failed to save: {target_path}")
         except Exception as e:
             errors.append(f"{target_path}: {e}")
+        finally:
+            if progress:
+                progress(done)
 
     return success, errors
 
@@ -162,7 +226,12 @@ def render_svg_to_image(svg_path: Path, size: int) -> QImage | None:
         return None
 
 
-def replace_layer_from_svg(svg_path: Path, layer: LayerType) -> tuple[int, list[str]]:
+def replace_layer_from_svg(
+    svg_path: Path,
+    layer: LayerType,
+    progress: ProgressCallback | None = None,
+    is_cancelled: CancelCallback | None = None
+) -> tuple[int, list[str]]:
     """
     Replace an adaptive icon layer from an SVG source.
 
@@ -171,6 +240,9 @@ def replace_layer_from_svg(svg_path: Path, layer: LayerType) -> tuple[int, list[
     Args:
         svg_path: Path to the source SVG file.
         layer: Layer type ("foreground", "background", or "notification").
+        progress: Optional callback receiving the number of targets processed.
+        is_cancelled: Optional callback; when it returns True, remaining
+            targets are skipped.
 
     Returns:
         Tuple of (success_count, error_messages).
@@ -192,7 +264,9 @@ def replace_layer_from_svg(svg_path: Path, layer: LayerType) -> tuple[int, list[
     success = 0
     errors = []
 
-    for target_path, size in targets:
+    for done, (target_path, size) in enumerate(targets, 1):
+        if is_cancelled and is_cancelled():
+            break
         try:
             # Render SVG at target size
             image = render_svg_to_image(svg_path, size)
@@ -210,6 +284,9 @@ def replace_layer_from_svg(svg_path: Path, layer: LayerType) -> tuple[int, list[
                 errors.append(f"Failed to save: {target_path}")
         except Exception as e:
             errors.append(f"{target_path}: {e}")
+        finally:
+            if progress:
+                progress(done)
 
     return success, errors
 
@@ -218,7 +295,9 @@ def replace_layer_with_overrides(
     source_path: Path,
     layer: LayerType,
     overrides: dict[str, Path] | None = None,
-    is_svg: bool = False
+    is_svg: bool = False,
+    progress: ProgressCallback | None = None,
+    is_cancelled: CancelCallback | None = None
 ) -> tuple[int, list[str]]:
     """
     Replace an adaptive icon layer with optional per-density overrides.
@@ -228,6 +307,9 @@ def replace_layer_with_overrides(
         layer: Layer type ("foreground", "background", or "notification").
         overrides: Dict mapping density names (e.g., "mipmap-xxhdpi") to override file paths.
         is_svg: If True, treat source_path as SVG.
+        progress: Optional callback receiving the number of targets processed.
+        is_cancelled: Optional callback; when it returns True, remaining
+            targets are skipped.
 
     Returns:
         Tuple of (success_count, error_messages).
@@ -249,7 +331,9 @@ def replace_layer_with_overrides(
     success = 0
     errors = []
 
-    for target_path, size in targets:
+    for done, (target_path, size) in enumerate(targets, 1):
+        if is_cancelled and is_cancelled():
+            break
         density = target_path.parent.name
         override_path = overrides.get(density)
 
@@ -296,5 +380,8 @@ def replace_layer_with_overrides(
                 errors.append(f"Failed to save: {target_path}")
         except Exception as e:
             errors.append(f"{target_path}: {e}")
+        finally:
+            if progress:
+                progress(done)
 
     return success, errors
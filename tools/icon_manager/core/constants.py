@@ -18,6 +18,12 @@ ASSETS_IOS_DIR = PROJECT_ROOT / "assets" / "base" / "release" / "icons" / "ios"
 # Config file (in the same folder as main.py)
 CONFIG_PATH = PACKAGE_DIR / "icon_manager_config.json"
 
+# Scanned icon bounds, reused across runs while the files are unchanged
+BOUNDS_CACHE_PATH = PACKAGE_DIR / "icon_bounds_cache.json"
+
+# Pixel hashes of generated icons, used to skip rewriting unchanged files
+RENDER_HASH_CACHE_PATH = PACKAGE_DIR / "render_hash_cache.json"
+
 # Android mipmap size mappings for legacy launcher icons (48dp base)
 MIPMAP_SIZES = {
     "mipmap-mdpi": 48,
@@ -127,15 +133,15 @@ class Theme:
                 background-color: {COLORS['surface_alt']};
                 border-color: {COLORS['primary_light']};
             }}
-            QTableWidget {{
+            QTableView {{
                 background-color: {COLORS['surface']};
                 alternate-background-color: {COLORS['row_alt']};
                 border: 1px solid {COLORS['border']};
                 border-radius: 6px;
                 gridline-color: {COLORS['border']};
             }}
-            QTableWidget::item {{ padding: 4px 8px; }}
-            QTableWidget::item:selected {{ background-color: {COLORS['selected']}; color: {COLORS['text_primary']}; }}
+            QTableView::item {{ padding: 4px 8px; }}
+            QTableView::item:selected {{ background-color: {COLORS['selected']}; color: {COLORS['text_primary']}; }}
             QHeaderView::section {{
                 background-color: {COLORS['surface_alt']};
                 color: {COLORS['text_primary']};
@@ -159,13 +165,13 @@ class Theme:
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
             QLabel {{ background-color: transparent; }}
             QCheckBox {{ background-color: transparent; }}
-            QCheckBox::indicator {{ width: 18px; height: 18px; }}
-            QCheckBox::indicator:unchecked {{
+            QCheckBox::indicator, QTableView::indicator {{ width: 18px; height: 18px; }}
+            QCheckBox::indicator:unchecked, QTableView::indicator:unchecked {{
                 border: 2px solid {COLORS['border']};
                 border-radius: 3px;
                 background: {COLORS['surface']};
             }}
-            QCheckBox::indicator:checked {{
+            QCheckBox::indicator:checked, QTableView::indicator:checked {{
                 border: 2px solid {COLORS['primary_light']};
                 border-radius: 3px;
                 background: {COLORS['primary_light']};
@@ -3,9 +3,10 @@ Data classes for the Icon Manager.
 """
 
 import json
+from functools import cached_property
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import astuple, dataclass, field
+from typing import Any, Generic, Optional, TypeVar
 
 from .constants import PROJECT_ROOT
 
@@ -43,14 +44,19 @@ class IconTarget:
     bounds: Optional[IconBounds] = None
     override_path: Optional[Path] = None  # Can be SVG or PNG
 
-    @property
+    @cached_property
     def rel_path(self) -> str:
-        """Get the path relative to project root."""
+        """Get the path relative to project root, computed on first access."""
         try:
             return str(self.path.relative_to(PROJECT_ROOT))
         except ValueError:
             return str(self.path)
 
+    @cached_property
+    def safe_export_name(self) -> str:
+        """Flat file name used for this target in export folders and ZIPs."""
+        return self.rel_path.replace("\\", "_").replace("/", "_")
+
     @property
     def override_is_png(self) -> bool:
         """Check if the override file is a PNG."""
@@ -92,3 +98,78 @@ class Config:
             )
         except (json.JSONDecodeError, KeyError):
             return cls()
+
+
+_V = TypeVar("_V")
+_CacheT = TypeVar("_CacheT", bound="MtimeCache")
+
+
+@dataclass
+class MtimeCache(Generic[_V]):
+    """
+    Per-file values kept in a JSON file, valid while the file mtime is unchanged.
+
+    Subclasses override _encode/_decode when their values are not plain
+    JSON types.
+    """
+    entries: dict[str, tuple[int, _V]] = field(default_factory=dict)  # path -> (mtime_ns, value)
+
+    def get(self, path: Path, mtime_ns: int) -> Optional[_V]:
+        """Get the cached value, or None if missing or the file has changed."""
+        entry = self.entries.get(str(path))
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1]
+        return None
+
+    def put(self, path: Path, mtime_ns: int, value: _V) -> None:
+        self.entries[str(path)] = (mtime_ns, value)
+
+    @staticmethod
+    def _encode(value: _V) -> Any:
+        return value
+
+    @staticmethod
+    def _decode(data: Any) -> _V:
+        return data
+
+    def save(self, path: Path) -> None:
+        """Save the cache to a JSON file."""
+        data = {
+            key: [mtime_ns, self._encode(value)]
+            for key, (mtime_ns, value) in self.entries.items()
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls: type[_CacheT], path: Path) -> _CacheT:
+        """Load the cache from a JSON file; a missing or broken file gives an empty cache."""
+        if not path.exists():
+            return cls()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return cls(entries={
+                key: (mtime_ns, cls._decode(value))
+                for key, (mtime_ns, value) in data.items()
+            })
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return cls()
+
+
+@dataclass
+class BoundsCache(MtimeCache[IconBounds]):
+    """Content bounds of scanned icons."""
+
+    @staticmethod
+    def _encode(value: IconBounds) -> Any:
+        return astuple(value)
+
+    @staticmethod
+    def _decode(data: Any) -> IconBounds:
+        return IconBounds(*data)
+
+
+@dataclass
+class RenderHashCache(MtimeCache[str]):
+    """Pixel hashes of the renders last written to generated icons."""
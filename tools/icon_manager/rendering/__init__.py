@@ -1,20 +1,34 @@
 """Image rendering utilities."""
 
 from .renderer import (
+    cached_checkerboard,
+    cached_checkerboard_image,
     create_checkerboard,
+    create_checkerboard_image,
     get_image_bounds,
     get_svg_content_bounds,
     load_icon_preview,
+    load_icon_preview_image,
+    load_svg_source,
+    prescale_fast,
+    preview_cache_key,
     render_png_to_bounds,
     render_svg_to_size,
     render_svg_cropped,
 )
 
 __all__ = [
+    'cached_checkerboard',
+    'cached_checkerboard_image',
     'create_checkerboard',
+    'create_checkerboard_image',
     'get_image_bounds',
     'get_svg_content_bounds',
     'load_icon_preview',
+    'load_icon_preview_image',
+    'load_svg_source',
+    'prescale_fast',
+    'preview_cache_key',
     'render_png_to_bounds',
     'render_svg_to_size',
     'render_svg_cropped',
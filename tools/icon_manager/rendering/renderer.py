@@ -8,53 +8,140 @@ This module handles all SVG and PNG rendering operations including:
 - PNG override rendering
 """
 
+import sys
+from dataclasses import astuple
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QSize, QRectF
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor
+from PyQt6.QtCore import Qt, QByteArray, QSize, QRectF
+from PyQt6.QtGui import QPixmap, QImage, QImageReader, QPainter, QColor, QTransform
 from PyQt6.QtSvg import QSvgRenderer
 
 from ..core import COLORS, IconBounds, IconTarget
 
+# Alpha values above this count as visible content
+ALPHA_THRESHOLD = 10
+
+# Rows per band when scanning for content bounds (64 rows of a 512px
+# render is a 128 KB slice, a 32 KB alpha plane)
+_SCAN_BAND_ROWS = 64
+
+# Byte offset of the alpha channel within an ARGB32 pixel in memory
+_ALPHA_OFFSET = 3 if sys.byteorder == "little" else 0
+
+# bytes.translate() table: 1 for visible alpha values, 0 otherwise
+_VISIBLE_ALPHA = bytes(1 if alpha > ALPHA_THRESHOLD else 0 for alpha in range(256))
+
+# Formats whose buffers get_image_bounds can scan without converting
+_ALPHA_SCAN_FORMATS = (
+    QImage.Format.Format_ARGB32,
+    QImage.Format.Format_ARGB32_Premultiplied,
+)
+
+
+def create_checkerboard_image(width: int, height: int, tile_size: int = 8) -> QImage:
+    """Create a checkerboard pattern image for transparency preview.
+
+    The pattern is assembled from two precomputed scanlines (light-first and
+    dark-first) rather than painting each tile. Unlike create_checkerboard(),
+    this is safe to call off the GUI thread.
+    """
+    light = QColor(COLORS["checker_light"]).rgba().to_bytes(4, sys.byteorder)
+    dark = QColor(COLORS["checker_dark"]).rgba().to_bytes(4, sys.byteorder)
+    row_bytes = width * 4
+    repeats = width // (2 * tile_size) + 1
+    light_row = ((light * tile_size + dark * tile_size) * repeats)[:row_bytes]
+    dark_row = ((dark * tile_size + light * tile_size) * repeats)[:row_bytes]
+
+    band_pair = light_row * tile_size + dark_row * tile_size
+    data = (band_pair * (height // (2 * tile_size) + 1))[:row_bytes * height]
+
+    # copy() so the image owns its pixels instead of borrowing `data`
+    return QImage(data, width, height, row_bytes, QImage.Format.Format_RGB32).copy()
+
 
 def create_checkerboard(width: int, height: int, tile_size: int = 8) -> QPixmap:
     """Create a checkerboard pattern pixmap for transparency preview."""
-    pixmap = QPixmap(width, height)
-    painter = QPainter(pixmap)
-    light = QColor(COLORS["checker_light"])
-    dark = QColor(COLORS["checker_dark"])
-    for y in range(0, height, tile_size):
-        for x in range(0, width, tile_size):
-            color = light if (x // tile_size + y // tile_size) % 2 == 0 else dark
-            painter.fillRect(x, y, tile_size, tile_size, color)
-    painter.end()
-    return pixmap
+    return QPixmap.fromImage(create_checkerboard_image(width, height, tile_size))
+
+
+@lru_cache(maxsize=8)
+def cached_checkerboard_image(width: int, height: int, tile_size: int = 8) -> QImage:
+    """
+    Shared checkerboard image; safe off the GUI thread.
+
+    The same image is returned on every call; copy() it before painting on top.
+    """
+    return create_checkerboard_image(width, height, tile_size)
+
+
+@lru_cache(maxsize=8)
+def cached_checkerboard(width: int, height: int, tile_size: int = 8) -> QPixmap:
+    """
+    Shared checkerboard pixmap (GUI thread only).
+
+    The same pixmap is returned on every call; copy() it before painting on top.
+    """
+    return create_checkerboard(width, height, tile_size)
+
+
+def prescale_fast(image: QImage, size: int,
+                  aspect: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio) -> QImage:
+    """
+    Cheaply shrink an image to at most twice size before a smooth scale to size.
+
+    Large sources take a nearest-neighbour pass first, so the smooth filter
+    only works on a small image. Smaller images are returned unchanged.
+    """
+    if max(image.width(), image.height()) > size * 2:
+        return image.scaled(size * 2, size * 2, aspect, Qt.TransformationMode.FastTransformation)
+    return image
 
 
 def get_image_bounds(image: QImage) -> IconBounds:
-    """Find the bounding box of non-transparent content in an image."""
+    """Find the bounding box of non-transparent content in an image.
+
+    The alpha plane is scanned in horizontal bands of _SCAN_BAND_ROWS rows
+    straight from the image buffer; bands without visible pixels are
+    skipped after a single C-level pass, so sparse icons cost little more
+    than a memory read.
+    """
     if image.isNull():
         return IconBounds()
 
     width = image.width()
     height = image.height()
 
-    if image.format() != QImage.Format.Format_ARGB32:
+    # Premultiplication leaves the alpha byte untouched, so both ARGB32
+    # variants can be scanned in place without a conversion copy
+    if image.format() not in _ALPHA_SCAN_FORMATS:
         image = image.convertToFormat(QImage.Format.Format_ARGB32)
 
+    # 32-bit scanlines are always tightly packed (bytesPerLine == width * 4)
+    data = image.constBits().asstring(image.sizeInBytes())
+    row_bytes = width * 4
+
     min_x, min_y = width, height
-    max_x, max_y = 0, 0
-
-    for y in range(height):
-        for x in range(width):
-            pixel = image.pixel(x, y)
-            alpha = (pixel >> 24) & 0xFF
-            if alpha > 10:  # Threshold for "visible" pixels
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                max_x = max(max_x, x)
-                max_y = max(max_y, y)
+    max_x, max_y = -1, -1
+
+    for band_y in range(0, height, _SCAN_BAND_ROWS):
+        band_rows = min(_SCAN_BAND_ROWS, height - band_y)
+        band = data[band_y * row_bytes:(band_y + band_rows) * row_bytes]
+        visible = band[_ALPHA_OFFSET::4].translate(_VISIBLE_ALPHA)
+        if 1 not in visible:
+            continue
+
+        for row in range(band_rows):
+            row_visible = visible[row * width:(row + 1) * width]
+            first = row_visible.find(1)
+            if first < 0:
+                continue
+            y = band_y + row
+            min_y = min(min_y, y)
+            max_y = y
+            min_x = min(min_x, first)
+            max_x = max(max_x, row_visible.rfind(1))
 
     # If no visible content found, return full bounds
     if max_x < min_x or max_y < min_y:
@@ -82,16 +169,70 @@ def get_svg_content_bounds(renderer: QSvgRenderer, render_size: int = 512) -> Ic
     return get_image_bounds(image)
 
 
+@lru_cache(maxsize=64)
+def _load_svg_source(path_str: str, mtime_ns: int) -> Optional[tuple[QByteArray, QSvgRenderer, IconBounds]]:
+    try:
+        with open(path_str, 'rb') as f:
+            data = QByteArray(f.read())
+    except OSError:
+        return None
+    renderer = QSvgRenderer(data)
+    if not renderer.isValid():
+        return None
+    return data, renderer, get_svg_content_bounds(renderer)
+
+
+def load_svg_source(path: Path) -> Optional[tuple[QByteArray, QSvgRenderer, IconBounds]]:
+    """
+    Load an SVG file as (bytes, renderer, content bounds), shared per file version.
+
+    Results are cached by path and mtime, so the preview widgets and icon
+    generation parse and measure each SVG once until it changes on disk.
+    Returns None if the file cannot be read or is not a valid SVG.
+
+    GUI thread only: the renderer must not be used from other threads;
+    workers parse their own from the bytes.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _load_svg_source(str(path), mtime_ns)
+
+
+def preview_cache_key(prefix: str, path: str | Path, mtime_ns: int, size: int) -> str:
+    """
+    QPixmapCache key for a preview of an icon file.
+
+    Keys include the file's mtime, so a rewritten file gets a new key and
+    misses. Old entries are left for QPixmapCache's LRU eviction.
+    """
+    return f"{prefix}:{size}:{mtime_ns}:{path}"
+
+
 def load_icon_preview(path: Path, size: int = 48) -> QPixmap:
     """Load an icon and create a preview with checkerboard background."""
-    result = create_checkerboard(size, size, 6)
-    icon = QImage(str(path))
-    if icon.isNull():
+    return QPixmap.fromImage(load_icon_preview_image(path, size))
+
+
+def load_icon_preview_image(path: Path, size: int = 48) -> QImage:
+    """
+    Load an icon preview as a QImage.
+
+    Same output as load_icon_preview, but safe to call off the GUI thread.
+    The icon is decoded straight to the preview size where the image format
+    supports it, so no full-size copy is kept around for the scale.
+    """
+    result = create_checkerboard_image(size, size, 6)
+    reader = QImageReader(str(path))
+    source_size = reader.size()
+    if not source_size.isValid():
+        return result
+    reader.setScaledSize(source_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+    scaled = reader.read()
+    if scaled.isNull():
         return result
 
-    scaled = icon.scaled(size, size,
-                         Qt.AspectRatioMode.KeepAspectRatio,
-                         Qt.TransformationMode.SmoothTransformation)
     painter = QPainter(result)
     x = (size - scaled.width()) // 2
     y = (size - scaled.height()) // 2
@@ -102,7 +243,7 @@ def load_icon_preview(path: Path, size: int = 48) -> QPixmap:
 
 def render_png_to_bounds(source: QImage, target: IconTarget) -> QImage:
     """Render a PNG override into the target's content bounds."""
-    image = QImage(target.width, target.height, QImage.Format.Format_ARGB32)
+    image = QImage(target.width, target.height, QImage.Format.Format_ARGB32_Premultiplied)
     image.fill(Qt.GlobalColor.transparent)
 
     if source.isNull():
@@ -134,18 +275,64 @@ def render_png_to_bounds(source: QImage, target: IconTarget) -> QImage:
 
     painter = QPainter(image)
     painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    # Single draw onto a cleared image: copy pixels instead of blending
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
     painter.drawImage(int(offset_x), int(offset_y), scaled)
     painter.end()
 
     return image
 
 
+@lru_cache(maxsize=32)
+def _base_svg_transform(bounds_key: tuple[int, ...], svg_width: int, svg_height: int) -> tuple[QTransform, float, float]:
+    """
+    Build the transform that moves the SVG's cropped content to the origin.
+
+    Depends only on the SVG (its content bounds and viewBox size), so it is computed
+    once per SVG and reused for every target size.
+
+    Returns:
+        Tuple of (transform, content_width, content_height) in SVG coordinates.
+    """
+    x, y, width, height, image_width, image_height = bounds_key
+
+    # Scale factors from bounds render size to SVG viewBox
+    scale_x = svg_width / image_width
+    scale_y = svg_height / image_height
+
+    transform = QTransform.fromTranslate(-x * scale_x, -y * scale_y)
+    return transform, width * scale_x, height * scale_y
+
+
+def _svg_crop_transform(renderer: QSvgRenderer, svg_bounds: IconBounds, dest_rect: QRectF) -> tuple[QTransform, QSize]:
+    """
+    Get the painter transform that fits the SVG's content into dest_rect.
+
+    Returns:
+        Tuple of (transform, svg_size) where svg_size is the rect to render the full SVG into.
+    """
+    svg_size = renderer.defaultSize()
+    if svg_size.isEmpty():
+        svg_size = QSize(svg_bounds.image_width, svg_bounds.image_height)
+
+    base, content_w, content_h = _base_svg_transform(
+        astuple(svg_bounds), svg_size.width(), svg_size.height()
+    )
+
+    # Fit content into dest_rect while maintaining aspect ratio, centered
+    scale = min(dest_rect.width() / content_w, dest_rect.height() / content_h)
+    offset_x = dest_rect.x() + (dest_rect.width() - content_w * scale) / 2
+    offset_y = dest_rect.y() + (dest_rect.height() - content_h * scale) / 2
+
+    return base * QTransform(scale, 0, 0, scale, offset_x, offset_y), svg_size
+
+
 def render_svg_to_size(renderer: QSvgRenderer, size: int, svg_bounds: Optional[IconBounds] = None) -> QImage:
     """
     Render an SVG to a square image of the given size, optionally cropping to content bounds.
     Used for preview rendering.
     """
-    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
     image.fill(Qt.GlobalColor.transparent)
 
     painter = QPainter(image)
@@ -154,26 +341,8 @@ def render_svg_to_size(renderer: QSvgRenderer, size: int, svg_bounds: Optional[I
 
     if svg_bounds and not svg_bounds.is_full and not svg_bounds.is_empty:
         # Render with cropping applied
-        svg_size = renderer.defaultSize()
-        if svg_size.isEmpty():
-            svg_size = QSize(svg_bounds.image_width, svg_bounds.image_height)
-
-        scale_x = svg_size.width() / svg_bounds.image_width
-        scale_y = svg_size.height() / svg_bounds.image_height
-        content_x = svg_bounds.x * scale_x
-        content_y = svg_bounds.y * scale_y
-        content_w = svg_bounds.width * scale_x
-        content_h = svg_bounds.height * scale_y
-
-        scale = min(size / content_w, size / content_h)
-        scaled_w = content_w * scale
-        scaled_h = content_h * scale
-        offset_x = (size - scaled_w) / 2
-        offset_y = (size - scaled_h) / 2
-
-        painter.translate(offset_x, offset_y)
-        painter.scale(scale, scale)
-        painter.translate(-content_x, -content_y)
+        transform, svg_size = _svg_crop_transform(renderer, svg_bounds, QRectF(0, 0, size, size))
+        painter.setTransform(transform)
         renderer.render(painter, QRectF(0, 0, svg_size.width(), svg_size.height()))
     else:
         # Render full SVG
@@ -190,7 +359,7 @@ def render_svg_cropped(renderer: QSvgRenderer, target: IconTarget, svg_bounds: I
     If the target has content bounds (e.g., adaptive icon foreground), the SVG content
     is rendered into that specific area. The SVG's own padding is cropped out.
     """
-    image = QImage(target.width, target.height, QImage.Format.Format_ARGB32)
+    image = QImage(target.width, target.height, QImage.Format.Format_ARGB32_Premultiplied)
     image.fill(Qt.GlobalColor.transparent)
 
     painter = QPainter(image)
@@ -206,33 +375,9 @@ def render_svg_cropped(renderer: QSvgRenderer, target: IconTarget, svg_bounds: I
 
     # If SVG has padding, we need to render only the content portion
     if not svg_bounds.is_full and not svg_bounds.is_empty:
-        svg_size = renderer.defaultSize()
-        if svg_size.isEmpty():
-            svg_size = QSize(svg_bounds.image_width, svg_bounds.image_height)
-
-        # Scale factors from render size to SVG viewBox
-        scale_x = svg_size.width() / svg_bounds.image_width
-        scale_y = svg_size.height() / svg_bounds.image_height
-
-        # The content rect in SVG coordinates
-        content_x = svg_bounds.x * scale_x
-        content_y = svg_bounds.y * scale_y
-        content_w = svg_bounds.width * scale_x
-        content_h = svg_bounds.height * scale_y
-
-        # Calculate scaling to fit content into dest_rect while maintaining aspect ratio
-        scale = min(dest_rect.width() / content_w, dest_rect.height() / content_h)
-
-        # Calculate the offset to center the content
-        scaled_w = content_w * scale
-        scaled_h = content_h * scale
-        offset_x = dest_rect.x() + (dest_rect.width() - scaled_w) / 2
-        offset_y = dest_rect.y() + (dest_rect.height() - scaled_h) / 2
-
-        # Set up transform: translate to dest, scale, then translate to crop the content
-        painter.translate(offset_x, offset_y)
-        painter.scale(scale, scale)
-        painter.translate(-content_x, -content_y)
+        # Single transform: crop to content, scale and center into dest_rect
+        transform, svg_size = _svg_crop_transform(renderer, svg_bounds, dest_rect)
+        painter.setTransform(transform)
 
         # Render the full SVG (the transform will crop/position it)
         renderer.render(painter, QRectF(0, 0, svg_size.width(), svg_size.height()))
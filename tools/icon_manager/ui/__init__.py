@@ -3,7 +3,7 @@
 from .widgets import IconPreviewLabel, ComparisonWidget, SvgInputWidget
 from .main_window import IconManagerWindow
 from .adaptive_tab import AdaptiveIconTab
-from .icons import get_icon
+from .icons import get_icon, prebuild_icons
 
 __all__ = [
     'IconPreviewLabel',
@@ -12,4 +12,5 @@ __all__ = [
     'IconManagerWindow',
     'AdaptiveIconTab',
     'get_icon',
+    'prebuild_icons',
 ]
@@ -6,7 +6,9 @@ with PNG previews for each density.
 """
 
 from pathlib import Path
+from typing import Iterator
 
+import mmap
 import os
 import subprocess
 import sys
@@ -17,40 +19,241 @@ from PyQt6.QtWidgets import (
     QGroupBox, QScrollArea, QFrame, QApplication,
     QProgressDialog, QLineEdit, QColorDialog, QMenu,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QImage, QPixmap, QPainter, QColor
-
-import re
+from PyQt6.QtCore import (
+    Qt, QByteArray, QThreadPool, QTimer, pyqtSlot,
+)
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache, QPainter, QColor
+from PyQt6.QtSvg import QSvgRenderer
 
 from ..core import (
     COLORS, ADAPTIVE_ICON_SIZES, MIPMAP_SIZES, ANDROID_RES_DIR, ASSETS_ANDROID_DIR,
     PROJECT_ROOT, replace_layer, replace_layer_from_svg, replace_layer_with_overrides,
-    get_layer_preview, get_layer_targets, get_layer_sizes,
+    get_layer_preview, get_layer_targets, get_layer_targets_map, get_layer_sizes,
+    invalidate_layer_cache,
+)
+from ..rendering import (
+    cached_checkerboard, cached_checkerboard_image, prescale_fast, preview_cache_key,
 )
-from ..rendering import create_checkerboard
 from .icons import get_icon
+from .workers import PreviewLoadTask, ProgressTask
 
 # Source type enumeration
 SOURCE_TYPE_PNG = "png"
 SOURCE_TYPE_SVG = "svg"
 
+# Display texts for every density and size the tab shows, built once;
+# layers only ever use ADAPTIVE_ICON_SIZES or MIPMAP_SIZES
+_DENSITY_NAMES = {
+    density: density.replace("mipmap-", "")
+    for density in (*ADAPTIVE_ICON_SIZES, *MIPMAP_SIZES)
+}
+_SIZE_LABELS = {
+    size: f"{size}×{size}"
+    for size in (*ADAPTIVE_ICON_SIZES.values(), *MIPMAP_SIZES.values())
+}
+
+# Notification accent color patterns (CustomPushNotificationHelper.java)
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_SETCOLOR_PREFIX = b'.setColor(Color.parseColor("'
+_SETCOLOR_SUFFIX = b'"))'
+_AUTOCANCEL_CALL = b'.setAutoCancel(true);'
+
+# Single stylesheet for the whole tab, applied once in AdaptiveIconTab._init_ui.
+# Widgets opt in through object names and the "role" property. Rule order and
+# specificity matter: container rules reach every descendant, so the more
+# specific widget rules below them must come later to win ties.
+_TAB_QSS = f"""
+    QScrollArea#layersScroll, QScrollArea#layersScroll * {{
+        background-color: {COLORS['background']};
+    }}
+    QScrollArea#previewScroll, QScrollArea#previewScroll * {{
+        background-color: {COLORS['background']};
+        border: none;
+    }}
+    QFrame#densityPreview, QFrame#densityPreview QFrame {{
+        background-color: {COLORS['surface']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 4px;
+    }}
+    QGroupBox#sectionGroup {{
+        background-color: {COLORS['surface']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 8px;
+        margin-top: 16px;
+        padding: 16px;
+        padding-top: 28px;
+    }}
+    QGroupBox#sectionGroup::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 12px;
+        color: {COLORS['text_primary']};
+        font-weight: bold;
+        font-size: 12pt;
+    }}
+    QPushButton#accentButton {{
+        background-color: {COLORS['primary_light']};
+        color: {COLORS['text_inverse']};
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }}
+    QPushButton#accentButton:hover {{ background-color: {COLORS['primary_hover']}; }}
+    QPushButton#accentButton:disabled {{
+        background-color: {COLORS['border']};
+        color: {COLORS['text_disabled']};
+    }}
+    QPushButton#overridesToggle {{
+        background: transparent;
+        border: none;
+        color: {COLORS['text_secondary']};
+        text-align: left;
+        padding: 4px 0;
+        font-size: 10pt;
+    }}
+    QPushButton#overridesToggle:hover {{
+        color: {COLORS['primary_light']};
+    }}
+    QLabel#colorSwatch {{
+        background-color: #888888;
+        border: 1px solid {COLORS['border']};
+        border-radius: 4px;
+    }}
+    QLabel#tabHeader {{ font-size: 16pt; font-weight: bold; color: {COLORS['text_primary']}; }}
+    QLabel[role="heading"] {{ font-weight: bold; color: {COLORS['text_primary']}; }}
+    QLabel[role="secondary"] {{ color: {COLORS['text_secondary']}; }}
+    QLabel[role="smallSecondary"] {{ color: {COLORS['text_secondary']}; font-size: 9pt; }}
+    QLabel[role="placeholder"] {{ color: {COLORS['text_disabled']}; font-style: italic; }}
+    QLabel[role="highlight"] {{ color: {COLORS['primary_light']}; }}
+"""
+
+
+def _is_hex6(text: str) -> bool:
+    """Check for a #RRGGBB color string."""
+    return len(text) == 7 and text[0] == '#' and _HEX_DIGITS.issuperset(text[1:])
+
+
+def _java_color_spans(data) -> Iterator[tuple[int, int]]:
+    """
+    Yield the (start, end) byte span of each setColor(...) hex value.
+
+    Plain substring search for the fixed call prefix; the 7 bytes after it
+    are only accepted when they form a #RRGGBB value closed by '"))'.
+    """
+    start = data.find(_SETCOLOR_PREFIX)
+    while start >= 0:
+        value_start = start + len(_SETCOLOR_PREFIX)
+        value_end = value_start + 7
+        value = bytes(data[value_start:value_end]).decode('ascii', 'replace')
+        if data[value_end:value_end + len(_SETCOLOR_SUFFIX)] == _SETCOLOR_SUFFIX and _is_hex6(value):
+            yield value_start, value_end
+        start = data.find(_SETCOLOR_PREFIX, value_start)
+
+
+def _find_java_color(path: Path) -> str | None:
+    """
+    Return the first setColor(...) hex value in a Java file, or None.
+
+    Searches the mmapped bytes directly; only the 7-byte value is decoded.
+    """
+    with open(path, 'rb') as f:
+        # mmap refuses empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start, end in _java_color_spans(mm):
+                return mm[start:end].decode('ascii')
+            return None
+
+
+def _patch_java_color(path: Path, color: str) -> bool:
+    """
+    Overwrite existing setColor(...) hex values in place.
+
+    The new value has the same length as the old one, so only those bytes are
+    written through an mmap instead of rewriting the whole file.
+
+    Returns:
+        True if at least one setColor call was patched.
+    """
+    with open(path, 'r+b') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0) as mm:
+            spans = list(_java_color_spans(mm))
+            for start, end in spans:
+                mm[start:end] = color.encode('ascii')
+            if spans:
+                mm.flush()
+    return bool(spans)
+
+
+def _set_role(widget: QWidget, role: str):
+    """Switch a widget's stylesheet role and re-apply the tab stylesheet to it."""
+    widget.setProperty("role", role)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+def _load_preview_image(path_str: str, size: int) -> QImage:
+    """
+    Decode an icon file and scale it to fit the preview size.
+
+    Uses only QImage, so it is safe to call from a worker thread.
+    """
+    img = QImage(path_str)
+    if img.isNull():
+        return img
+    img = prescale_fast(img, size)
+    return img.scaled(
+        size, size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+
+def _composite_preview(image: QImage, size: int) -> QImage:
+    """Center a scaled preview image over the checkerboard (QImage only, thread safe)."""
+    if not image.hasAlphaChannel() and image.width() == size and image.height() == size:
+        # Opaque and full-size: the checkerboard would be painted over entirely
+        return image
+    checkerboard = cached_checkerboard_image(size, size, 8).copy()
+    if not image.isNull():
+        painter = QPainter(checkerboard)
+        x = (size - image.width()) // 2
+        y = (size - image.height()) // 2
+        painter.drawImage(x, y, image)
+        painter.end()
+    return checkerboard
+
+
+def _load_composited_preview(path_str: str, size: int) -> QImage:
+    """Decode, scale and composite one preview image (thread safe)."""
+    return _composite_preview(_load_preview_image(path_str, size), size)
+
 
 class DensityPreview(QFrame):
     """Preview widget for a single density's icon."""
 
+    # Edge length of the checkerboard preview inside the 80x80 label
+    PREVIEW_SIZE = 72
+
     def __init__(self, density: str, size: int, parent=None):
         super().__init__(parent)
         self.density = density
         self.size = size
         self.current_path: Path | None = None
+        # Key of the preview being loaded; late worker results for any other
+        # key are dropped
+        self._pending_key: str | None = None
+        # Cache key of the pixmap currently on screen, if it shows a file
+        self._shown_key: str | None = None
+        # Built on first right-click; actions read current_path when triggered
+        self._context_menu: QMenu | None = None
+        self._preview_task: PreviewLoadTask | None = None
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Sunken)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-            }}
-        """)
+        self.setObjectName("densityPreview")
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
 
@@ -59,9 +262,9 @@ class DensityPreview(QFrame):
         layout.setContentsMargins(8, 8, 8, 8)
 
         # Density label
-        self.density_label = QLabel(density.replace("mipmap-", ""))
+        self.density_label = QLabel(_DENSITY_NAMES[density])
         self.density_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.density_label.setStyleSheet(f"font-weight: bold; color: {COLORS['text_primary']};")
+        self.density_label.setProperty("role", "heading")
         layout.addWidget(self.density_label)
 
         # Preview image
@@ -72,54 +275,90 @@ class DensityPreview(QFrame):
         layout.addWidget(self.preview_label)
 
         # Size label
-        self.size_label = QLabel(f"{size}×{size}")
+        self.size_label = QLabel(_SIZE_LABELS[size])
         self.size_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.size_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 9pt;")
+        self.size_label.setProperty("role", "smallSecondary")
         layout.addWidget(self.size_label)
 
         self.setFixedWidth(100)
 
     def set_preview(self, path: Path | None):
-        """Set the preview image from a file path."""
+        """
+        Set the preview image from a file path.
+
+        Cached previews are shown immediately; otherwise the file is decoded
+        on the thread pool and the label updates when the result arrives.
+        """
         self.current_path = path
-        preview_size = 72
-        checkerboard = create_checkerboard(preview_size, preview_size, 8)
-
-        if path and path.exists():
-            img = QImage(str(path))
-            if not img.isNull():
-                scaled = img.scaled(
-                    preview_size, preview_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                painter = QPainter(checkerboard)
-                x = (preview_size - scaled.width()) // 2
-                y = (preview_size - scaled.height()) // 2
-                painter.drawImage(x, y, scaled)
-                painter.end()
+        self._pending_key = None
+        preview_size = self.PREVIEW_SIZE
 
-        self.preview_label.setPixmap(checkerboard)
+        # One stat() both checks existence and provides the cache key's mtime
+        try:
+            mtime_ns = path.stat().st_mtime_ns if path else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is None:
+            self._preview_task = None
+            self._shown_key = None
+            self.preview_label.setPixmap(cached_checkerboard(preview_size, preview_size, 8))
+            return
+
+        path_str = str(path)
+        key = preview_cache_key("adaptive-preview", path_str, mtime_ns, preview_size)
+        if key == self._shown_key:
+            # Same file, unchanged on disk: nothing to redo
+            self._preview_task = None
+            return
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            self._preview_task = None
+            self._shown_key = key
+            self.preview_label.setPixmap(pixmap)
+            return
+
+        self._pending_key = key
+        task = PreviewLoadTask(_load_composited_preview, path_str, preview_size, key)
+        task.signals.loaded.connect(self._on_preview_loaded)
+        # Keep a reference so the signals outlive the pool's copy of the task
+        self._preview_task = task
+        QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(str, str, QImage)
+    def _on_preview_loaded(self, key: str, path_str: str, image: QImage):
+        """Show a composited preview unless a newer request superseded it."""
+        if key != self._pending_key:
+            return
+        self._preview_task = None
+        # The only QImage -> QPixmap conversion on the preview path
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        self._pending_key = None
+        self._shown_key = key
+        self.preview_label.setPixmap(pixmap)
 
     def _show_context_menu(self, pos):
         """Show context menu with folder options."""
         if not self.current_path:
             return
 
-        menu = QMenu(self)
+        if self._context_menu is None:
+            menu = QMenu(self)
+
+            open_folder_action = menu.addAction("Open Folder")
+            open_folder_action.triggered.connect(self._open_folder)
 
-        open_folder_action = menu.addAction("Open Folder")
-        open_folder_action.triggered.connect(self._open_folder)
+            open_file_action = menu.addAction("Open File")
+            open_file_action.triggered.connect(self._open_file)
 
-        open_file_action = menu.addAction("Open File")
-        open_file_action.triggered.connect(self._open_file)
+            menu.addSeparator()
 
-        menu.addSeparator()
+            copy_path_action = menu.addAction("Copy Path")
+            copy_path_action.triggered.connect(self._copy_path)
 
-        copy_path_action = menu.addAction("Copy Path")
-        copy_path_action.triggered.connect(self._copy_path)
+            self._context_menu = menu
 
-        menu.exec(self.mapToGlobal(pos))
+        self._context_menu.exec(self.mapToGlobal(pos))
 
     def _open_folder(self):
         """Open the folder containing the icon file."""
@@ -176,24 +415,7 @@ class LayerGroup(QGroupBox):
         self.previews: dict[str, DensityPreview] = {}
         self.sizes = get_layer_sizes(layer)
 
-        self.setStyleSheet(f"""
-            QGroupBox {{
-                background-color: {COLORS['surface']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                margin-top: 16px;
-                padding: 16px;
-                padding-top: 28px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 12px;
-                color: {COLORS['text_primary']};
-                font-weight: bold;
-                font-size: 12pt;
-            }}
-        """)
+        self.setObjectName("sectionGroup")
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -202,17 +424,17 @@ class LayerGroup(QGroupBox):
         desc_text = config["desc"]
         desc = QLabel(desc_text)
         desc.setWordWrap(True)
-        desc.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        desc.setProperty("role", "secondary")
         layout.addWidget(desc)
 
         # Source section
         source_layout = QHBoxLayout()
         source_label = QLabel("Source:")
-        source_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        source_label.setProperty("role", "secondary")
         source_layout.addWidget(source_label)
 
         self.source_path_label = QLabel("No file selected")
-        self.source_path_label.setStyleSheet(f"color: {COLORS['text_disabled']}; font-style: italic;")
+        self.source_path_label.setProperty("role", "placeholder")
         source_layout.addWidget(self.source_path_label, 1)
 
         self.browse_png_btn = QPushButton(get_icon("browse", 14), "Select PNG...")
@@ -228,23 +450,7 @@ class LayerGroup(QGroupBox):
         self.replace_btn = QPushButton("Replace All")
         self.replace_btn.setEnabled(False)
         self.replace_btn.setMinimumWidth(100)
-        self.replace_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['primary_light']};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['primary_hover']};
-            }}
-            QPushButton:disabled {{
-                background-color: {COLORS['border']};
-                color: {COLORS['text_disabled']};
-            }}
-        """)
+        self.replace_btn.setObjectName("accentButton")
         source_layout.addWidget(self.replace_btn)
 
         layout.addLayout(source_layout)
@@ -253,19 +459,7 @@ class LayerGroup(QGroupBox):
         self.overrides_toggle = QPushButton("▶ Per-Density Overrides")
         self.overrides_toggle.setCheckable(True)
         self.overrides_toggle.setChecked(False)
-        self.overrides_toggle.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                color: {COLORS['text_secondary']};
-                text-align: left;
-                padding: 4px 0;
-                font-size: 10pt;
-            }}
-            QPushButton:hover {{
-                color: {COLORS['primary_light']};
-            }}
-        """)
+        self.overrides_toggle.setObjectName("overridesToggle")
         self.overrides_toggle.clicked.connect(self._toggle_overrides)
         layout.addWidget(self.overrides_toggle)
 
@@ -280,14 +474,13 @@ class LayerGroup(QGroupBox):
         row = 0
         for density, size in self.sizes.items():
             # Density name
-            density_name = density.replace("mipmap-", "")
-            density_label = QLabel(f"{density_name} ({size}×{size}):")
-            density_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+            density_label = QLabel(f"{_DENSITY_NAMES[density]} ({_SIZE_LABELS[size]}):")
+            density_label.setProperty("role", "secondary")
             overrides_layout.addWidget(density_label, row, 0)
 
             # Override path/status
             override_label = QLabel("(using default)")
-            override_label.setStyleSheet(f"color: {COLORS['text_disabled']}; font-style: italic;")
+            override_label.setProperty("role", "placeholder")
             overrides_layout.addWidget(override_label, row, 1)
 
             # Set override button
@@ -316,7 +509,7 @@ class LayerGroup(QGroupBox):
         # Current icons
         current_group = QVBoxLayout()
         current_label = QLabel("Current Icons:")
-        current_label.setStyleSheet(f"font-weight: bold; color: {COLORS['text_primary']};")
+        current_label.setProperty("role", "heading")
         current_group.addWidget(current_label)
 
         current_scroll = QScrollArea()
@@ -324,7 +517,7 @@ class LayerGroup(QGroupBox):
         current_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         current_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         current_scroll.setFixedHeight(140)
-        current_scroll.setStyleSheet(f"background-color: {COLORS['background']}; border: none;")
+        current_scroll.setObjectName("previewScroll")
 
         current_container = QWidget()
         current_layout = QHBoxLayout(current_container)
@@ -346,6 +539,7 @@ class LayerGroup(QGroupBox):
         # Store source info
         self.source_path: Path | None = None
         self.source_type: str = SOURCE_TYPE_PNG
+        self.source_size: tuple[int, int] | None = None
         self.override_paths: dict[str, Path] = {}
 
         # Keep browse_btn for backwards compatibility (used in main tab connection)
@@ -373,7 +567,7 @@ class LayerGroup(QGroupBox):
         # Update UI
         label, _, clear_btn = self.density_overrides[density]
         label.setText(override_path.name)
-        label.setStyleSheet(f"color: {COLORS['primary_light']};")
+        _set_role(label, "highlight")
         label.setToolTip(str(override_path))
         clear_btn.setEnabled(True)
 
@@ -384,26 +578,27 @@ class LayerGroup(QGroupBox):
 
         label, _, clear_btn = self.density_overrides[density]
         label.setText("(using default)")
-        label.setStyleSheet(f"color: {COLORS['text_disabled']}; font-style: italic;")
+        _set_role(label, "placeholder")
         label.setToolTip("")
         clear_btn.setEnabled(False)
 
     def refresh_previews(self):
         """Refresh all preview images from disk."""
-        targets = get_layer_targets(self.layer)
-        target_map = {t[0].parent.name: t[0] for t in targets}
+        target_map = get_layer_targets_map(self.layer)
 
         for density, preview in self.previews.items():
             path = target_map.get(density)
             preview.set_preview(path)
 
-    def set_source(self, path: Path, source_type: str = SOURCE_TYPE_PNG):
-        """Set the source file path and type."""
+    def set_source(self, path: Path, source_type: str = SOURCE_TYPE_PNG,
+                   size: tuple[int, int] | None = None):
+        """Set the source file path, type and (already measured) pixel size."""
         self.source_path = path
         self.source_type = source_type
+        self.source_size = size
         ext = path.suffix.upper()
         self.source_path_label.setText(f"{path.name} ({ext})")
-        self.source_path_label.setStyleSheet(f"color: {COLORS['primary_light']};")
+        _set_role(self.source_path_label, "highlight")
         self.source_path_label.setToolTip(str(path))
         self.replace_btn.setEnabled(True)
 
@@ -418,17 +613,39 @@ class AdaptiveIconTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._last_browse_dir: str | None = None
-        self._init_ui()
-        self._refresh_all_previews()
+        self._replace_task: ProgressTask | None = None
+        # Reused for every replacement; created on first use because a
+        # QProgressDialog schedules itself to pop up as soon as it exists
+        self._progress: QProgressDialog | None = None
+        # Coalesce color field keystrokes into one preview update
+        self._color_debounce = QTimer(self)
+        self._color_debounce.setSingleShot(True)
+        self._color_debounce.setInterval(80)
+        self._color_debounce.timeout.connect(self._apply_color_from_input)
+        # Color currently shown by the swatch; None is the grey fallback
+        self._last_color_preview: str | None = None
+        # The whole UI, the Java color lookup and the ~30 preview decodes
+        # wait for the first showEvent
+        self._ui_built = False
+
+    def showEvent(self, event):
+        if not self._ui_built:
+            self._init_ui()
+            self._build_groups()
+            self._ui_built = True
+            self._refresh_all_previews()
+        super().showEvent(event)
 
     def _init_ui(self):
+        self.setStyleSheet(_TAB_QSS)
+
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Header
         header = QLabel("Android Icon Layers")
-        header.setStyleSheet(f"font-size: 16pt; font-weight: bold; color: {COLORS['text_primary']};")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
 
         # Info text
@@ -437,60 +654,24 @@ class AdaptiveIconTab(QWidget):
             "Each source PNG is automatically scaled to all mipmap density folders."
         )
         info.setWordWrap(True)
-        info.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        info.setProperty("role", "secondary")
         layout.addWidget(info)
 
         # Scroll area for the groups
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet(f"background-color: {COLORS['background']};")
+        scroll.setObjectName("layersScroll")
 
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setSpacing(16)
-
-        # Foreground group
-        self.fg_group = LayerGroup("foreground")
-        self.fg_group.browse_png_btn.clicked.connect(lambda: self._browse_source("foreground", SOURCE_TYPE_PNG))
-        self.fg_group.browse_svg_btn.clicked.connect(lambda: self._browse_source("foreground", SOURCE_TYPE_SVG))
-        self.fg_group.replace_btn.clicked.connect(lambda: self._replace_layer("foreground"))
-        scroll_layout.addWidget(self.fg_group)
-
-        # Background group
-        self.bg_group = LayerGroup("background")
-        self.bg_group.browse_png_btn.clicked.connect(lambda: self._browse_source("background", SOURCE_TYPE_PNG))
-        self.bg_group.browse_svg_btn.clicked.connect(lambda: self._browse_source("background", SOURCE_TYPE_SVG))
-        self.bg_group.replace_btn.clicked.connect(lambda: self._replace_layer("background"))
-        scroll_layout.addWidget(self.bg_group)
-
-        # Notification icon group
-        self.notif_group = LayerGroup("notification")
-        self.notif_group.browse_png_btn.clicked.connect(lambda: self._browse_source("notification", SOURCE_TYPE_PNG))
-        self.notif_group.browse_svg_btn.clicked.connect(lambda: self._browse_source("notification", SOURCE_TYPE_SVG))
-        self.notif_group.replace_btn.clicked.connect(lambda: self._replace_layer("notification"))
-        scroll_layout.addWidget(self.notif_group)
+        # Layer groups are inserted above the color section by _build_groups()
+        self._scroll_layout = scroll_layout
 
         # Notification accent color section
         self.color_group = QGroupBox("Notification Accent Color")
-        self.color_group.setStyleSheet(f"""
-            QGroupBox {{
-                background-color: {COLORS['surface']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                margin-top: 16px;
-                padding: 16px;
-                padding-top: 28px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 12px;
-                color: {COLORS['text_primary']};
-                font-weight: bold;
-                font-size: 12pt;
-            }}
-        """)
+        self.color_group.setObjectName("sectionGroup")
         color_layout = QVBoxLayout(self.color_group)
         color_layout.setSpacing(12)
 
@@ -499,17 +680,17 @@ class AdaptiveIconTab(QWidget):
             "This is set in CustomPushNotificationHelper.java via setColor()."
         )
         color_desc.setWordWrap(True)
-        color_desc.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        color_desc.setProperty("role", "secondary")
         color_layout.addWidget(color_desc)
 
         color_row = QHBoxLayout()
         color_label = QLabel("Accent Color:")
-        color_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        color_label.setProperty("role", "secondary")
         color_row.addWidget(color_label)
 
         self.color_preview = QLabel()
         self.color_preview.setFixedSize(32, 32)
-        self.color_preview.setStyleSheet(f"background-color: #888888; border: 1px solid {COLORS['border']}; border-radius: 4px;")
+        self.color_preview.setObjectName("colorSwatch")
         color_row.addWidget(self.color_preview)
 
         self.color_input = QLineEdit()
@@ -526,21 +707,7 @@ class AdaptiveIconTab(QWidget):
 
         self.apply_color_btn = QPushButton("Apply to Java")
         self.apply_color_btn.setFixedWidth(120)
-        self.apply_color_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['primary_light']};
-                color: {COLORS['text_inverse']};
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{ background-color: {COLORS['primary_hover']}; }}
-            QPushButton:disabled {{
-                background-color: {COLORS['border']};
-                color: {COLORS['text_disabled']};
-            }}
-        """)
+        self.apply_color_btn.setObjectName("accentButton")
         self.apply_color_btn.clicked.connect(self._apply_notification_color)
         color_row.addWidget(self.apply_color_btn)
 
@@ -567,11 +734,41 @@ class AdaptiveIconTab(QWidget):
         actions.addStretch()
 
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        self.status_label.setProperty("role", "secondary")
         actions.addWidget(self.status_label)
 
         layout.addLayout(actions)
 
+    def _build_groups(self):
+        """Create the three layer groups at the top of the scroll area."""
+        # Insert all groups with updates off so the scroll content lays out
+        # and paints once instead of after each insertion
+        content = self._scroll_layout.parentWidget()
+        content.setUpdatesEnabled(False)
+        try:
+            # Foreground group
+            self.fg_group = LayerGroup("foreground")
+            self.fg_group.browse_png_btn.clicked.connect(lambda: self._browse_source("foreground", SOURCE_TYPE_PNG))
+            self.fg_group.browse_svg_btn.clicked.connect(lambda: self._browse_source("foreground", SOURCE_TYPE_SVG))
+            self.fg_group.replace_btn.clicked.connect(lambda: self._replace_layer("foreground"))
+            self._scroll_layout.insertWidget(0, self.fg_group)
+
+            # Background group
+            self.bg_group = LayerGroup("background")
+            self.bg_group.browse_png_btn.clicked.connect(lambda: self._browse_source("background", SOURCE_TYPE_PNG))
+            self.bg_group.browse_svg_btn.clicked.connect(lambda: self._browse_source("background", SOURCE_TYPE_SVG))
+            self.bg_group.replace_btn.clicked.connect(lambda: self._replace_layer("background"))
+            self._scroll_layout.insertWidget(1, self.bg_group)
+
+            # Notification icon group
+            self.notif_group = LayerGroup("notification")
+            self.notif_group.browse_png_btn.clicked.connect(lambda: self._browse_source("notification", SOURCE_TYPE_PNG))
+            self.notif_group.browse_svg_btn.clicked.connect(lambda: self._browse_source("notification", SOURCE_TYPE_SVG))
+            self.notif_group.replace_btn.clicked.connect(lambda: self._replace_layer("notification"))
+            self._scroll_layout.insertWidget(2, self.notif_group)
+        finally:
+            content.setUpdatesEnabled(True)
+
     def _get_browse_dir(self) -> str:
         """Get the directory to start file dialogs in."""
         if self._last_browse_dir and Path(self._last_browse_dir).exists():
@@ -612,27 +809,31 @@ class AdaptiveIconTab(QWidget):
         # Validate based on source type
         if source_type == SOURCE_TYPE_SVG:
             try:
-                from PyQt6.QtCore import QByteArray
-                from PyQt6.QtSvg import QSvgRenderer
                 with open(source_path, 'rb') as f:
                     svg_data = f.read()
                 renderer = QSvgRenderer(QByteArray(svg_data))
                 if not renderer.isValid():
                     QMessageBox.warning(self, "Invalid SVG", "Could not parse the selected SVG file.")
                     return
-                size_info = f"{renderer.defaultSize().width()}×{renderer.defaultSize().height()}"
+                default_size = renderer.defaultSize()
+                source_size = (default_size.width(), default_size.height())
             except Exception as e:
                 QMessageBox.warning(self, "Invalid SVG", f"Could not load the selected SVG file:\n{e}")
                 return
         else:
-            img = QImage(str(source_path))
-            if img.isNull():
+            # Header-only check; pixels are decoded later by the replace worker
+            reader = QImageReader(str(source_path))
+            reader.setDecideFormatFromContent(True)
+            size = reader.size()
+            if not reader.canRead() or not size.isValid():
                 QMessageBox.warning(self, "Invalid PNG", "Could not load the selected PNG file.")
                 return
-            size_info = f"{img.width()}×{img.height()}"
+            source_size = (size.width(), size.height())
 
-        group.set_source(source_path, source_type)
-        self.status_label.setText(f"Selected {layer}: {source_path.name} ({size_info})")
+        group.set_source(source_path, source_type, source_size)
+        self.status_label.setText(
+            f"Selected {layer}: {source_path.name} ({source_size[0]}×{source_size[1]})"
+        )
 
     def _replace_layer(self, layer: str):
         """Replace a layer across all densities."""
@@ -651,7 +852,9 @@ class AdaptiveIconTab(QWidget):
             title = f"Replace {layer.title()} Layer"
 
         # Build confirmation message
-        source_type = group.source_type.upper()
+        source_info = group.source_type.upper()
+        if group.source_size:
+            source_info += f", {group.source_size[0]}×{group.source_size[1]}"
         overrides_info = ""
         if group.has_overrides():
             override_count = len(group.override_paths)
@@ -662,39 +865,82 @@ class AdaptiveIconTab(QWidget):
             f"This will replace {filename} in all mipmap density folders:\n\n"
             f"  • android/app/src/main/res/mipmap-*/\n"
             f"  • assets/base/release/icons/android/mipmap-*/\n\n"
-            f"Source: {group.source_path.name} ({source_type}){overrides_info}\n\n"
+            f"Source: {group.source_path.name} ({source_info}){overrides_info}\n\n"
             "Continue?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Replace
-        progress = QProgressDialog(f"Replacing {layer}...", None, 0, 0, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
-        QApplication.processEvents()
-
         # Choose the appropriate replacement function
         if group.has_overrides():
             # Use the override-aware function
-            success, errors = replace_layer_with_overrides(
+            task = ProgressTask(
+                replace_layer_with_overrides,
                 group.source_path,
                 layer,
-                overrides=group.override_paths,
+                overrides=dict(group.override_paths),
                 is_svg=(group.source_type == SOURCE_TYPE_SVG)
             )
         elif group.source_type == SOURCE_TYPE_SVG:
             # Use SVG-specific function
-            success, errors = replace_layer_from_svg(group.source_path, layer)
+            task = ProgressTask(replace_layer_from_svg, group.source_path, layer)
         else:
             # Use standard PNG replacement
-            success, errors = replace_layer(group.source_path, layer)
+            task = ProgressTask(replace_layer, group.source_path, layer)
+
+        # Replace in the background; the dialog advances once per density
+        progress = self._get_progress_dialog()
+        progress.setLabelText(f"Replacing {layer}...")
+        progress.setRange(0, len(get_layer_targets(layer)))
+        progress.setValue(0)
+        progress.show()
 
-        progress.close()
+        task.signals.progress.connect(self._on_replace_progress)
+        task.signals.finished.connect(
+            lambda success, errors: self._on_replace_finished(layer, success, errors)
+        )
+        # Keep a reference so the signals outlive the pool's copy of the task
+        self._replace_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _get_progress_dialog(self) -> QProgressDialog:
+        """Return the tab's replacement progress dialog, creating it on first use."""
+        if self._progress is None:
+            self._progress = QProgressDialog("", "Cancel", 0, 0, self)
+            self._progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._progress.setMinimumDuration(0)
+            self._progress.canceled.connect(self._cancel_replace)
+        return self._progress
+
+    def _cancel_replace(self):
+        """Ask the running replacement, if any, to stop."""
+        if self._replace_task is not None:
+            self._replace_task.cancel()
+
+    def _on_replace_progress(self, done: int):
+        """Advance the progress dialog unless the replacement was cancelled."""
+        # Cancel reset() the dialog; a late setValue() would show it again
+        if self._replace_task is None or self._replace_task.cancelled:
+            return
+        self._progress.setValue(done)
+
+    def _on_replace_finished(self, layer: str, success: int, errors: list[str]):
+        """Report the result of a background layer replacement."""
+        # Read the flag and drop the task first: closing the dialog emits
+        # canceled() itself
+        cancelled = self._replace_task is not None and self._replace_task.cancelled
+        self._replace_task = None
+        self._progress.close()
+        invalidate_layer_cache()
+        group = self._get_group(layer)
 
-        if errors:
+        if cancelled:
+            QMessageBox.information(
+                self, "Cancelled",
+                f"Replacement cancelled after {success} {layer} files."
+            )
+        elif errors:
             QMessageBox.warning(
                 self, "Completed with Errors",
                 f"Replaced {success} files.\n\nErrors:\n" + "\n".join(errors[:10])
@@ -707,13 +953,21 @@ class AdaptiveIconTab(QWidget):
 
         # Refresh previews
         group.refresh_previews()
-        self.status_label.setText(f"Replaced {success} {layer} files")
+        status = "Cancelled after replacing" if cancelled else "Replaced"
+        self.status_label.setText(f"{status} {success} {layer} files")
 
     def _refresh_all_previews(self):
         """Refresh all preview images."""
-        self.fg_group.refresh_previews()
-        self.bg_group.refresh_previews()
-        self.notif_group.refresh_previews()
+        # Rescan the mipmap directories; unchanged files are still skipped
+        # per preview by mtime
+        invalidate_layer_cache()
+        # Cached previews are set synchronously; repaint each group once
+        for group in (self.fg_group, self.bg_group, self.notif_group):
+            group.setUpdatesEnabled(False)
+            try:
+                group.refresh_previews()
+            finally:
+                group.setUpdatesEnabled(True)
         self.status_label.setText("Previews refreshed")
 
     def _get_java_helper_path(self) -> Path:
@@ -729,11 +983,10 @@ class AdaptiveIconTab(QWidget):
             return
 
         try:
-            content = java_path.read_text(encoding='utf-8')
             # Look for .setColor(Color.parseColor("#XXXXXX"))
-            match = re.search(r'\.setColor\(Color\.parseColor\("(#[0-9A-Fa-f]{6})"\)\)', content)
-            if match:
-                color = match.group(1).upper()
+            color = _find_java_color(java_path)
+            if color:
+                color = color.upper()
                 self.color_input.setText(color)
                 self._update_color_preview(color)
             else:
@@ -743,28 +996,30 @@ class AdaptiveIconTab(QWidget):
             self.status_label.setText(f"Error reading Java file: {e}")
 
     def _on_color_input_changed(self, text: str):
-        """Update preview when color input changes."""
-        text = text.strip()
-        if re.match(r'^#[0-9A-Fa-f]{6}$', text):
+        """Schedule a preview update; restarts the debounce on every keystroke."""
+        self._color_debounce.start()
+
+    def _apply_color_from_input(self):
+        """Update preview from the color input once typing pauses."""
+        text = self.color_input.text().strip()
+        if _is_hex6(text):
             self._update_color_preview(text)
         else:
             self._update_color_preview(None)
 
     def _update_color_preview(self, color: str | None):
         """Update the color preview label."""
-        if color:
-            self.color_preview.setStyleSheet(
-                f"background-color: {color}; border: 1px solid {COLORS['border']}; border-radius: 4px;"
-            )
-        else:
-            self.color_preview.setStyleSheet(
-                f"background-color: #888888; border: 1px solid {COLORS['border']}; border-radius: 4px;"
-            )
+        if color == self._last_color_preview:
+            return
+        self._last_color_preview = color
+        # Only the fill is dynamic; the border and the grey fallback come
+        # from the tab stylesheet
+        self.color_preview.setStyleSheet(f"background-color: {color};" if color else "")
 
     def _pick_color(self):
         """Open color picker dialog."""
         current = self.color_input.text().strip()
-        initial = QColor(current) if re.match(r'^#[0-9A-Fa-f]{6}$', current) else QColor("#F2A900")
+        initial = QColor(current) if _is_hex6(current) else QColor("#F2A900")
 
         color = QColorDialog.getColor(initial, self, "Select Notification Accent Color")
         if color.isValid():
@@ -775,7 +1030,7 @@ class AdaptiveIconTab(QWidget):
     def _apply_notification_color(self):
         """Apply the notification color to the Java file."""
         color = self.color_input.text().strip().upper()
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', color):
+        if not _is_hex6(color):
             QMessageBox.warning(self, "Invalid Color", "Please enter a valid hex color (e.g., #F2A900)")
             return
 
@@ -785,24 +1040,25 @@ class AdaptiveIconTab(QWidget):
             return
 
         try:
-            content = java_path.read_text(encoding='utf-8')
+            content = java_path.read_bytes()
 
             # Check if setColor already exists
-            if '.setColor(Color.parseColor(' in content:
-                # Replace existing color
-                new_content = re.sub(
-                    r'\.setColor\(Color\.parseColor\("#[0-9A-Fa-f]{6}"\)\)',
-                    f'.setColor(Color.parseColor("{color}"))',
-                    content
-                )
+            if _SETCOLOR_PREFIX in content:
+                # Replace existing color in place
+                applied = _patch_java_color(java_path, color)
             else:
                 # Add setColor before the semicolon after .setAutoCancel(true)
-                new_content = content.replace(
-                    '.setAutoCancel(true);',
-                    f'.setAutoCancel(true)\n                .setColor(Color.parseColor("{color}")); // Notification accent color'
-                )
-
-            if new_content == content:
+                idx = content.find(_AUTOCANCEL_CALL)
+                applied = idx >= 0
+                if applied:
+                    end = idx + len(_AUTOCANCEL_CALL)
+                    insert = f'\n                .setColor(Color.parseColor("{color}")); // Notification accent color'
+                    # Write a sibling file and swap it in, so readers never see a partial file
+                    tmp_path = java_path.with_suffix(java_path.suffix + '.tmp')
+                    tmp_path.write_bytes(content[:end - 1] + insert.encode('ascii') + content[end:])
+                    os.replace(tmp_path, java_path)
+
+            if not applied:
                 QMessageBox.warning(
                     self, "Could Not Apply",
                     "Could not find the expected code pattern in the Java file.\n"
@@ -810,7 +1066,6 @@ class AdaptiveIconTab(QWidget):
                 )
                 return
 
-            java_path.write_text(new_content, encoding='utf-8')
             QMessageBox.information(
                 self, "Success",
                 f"Applied notification accent color: {color}\n\n"
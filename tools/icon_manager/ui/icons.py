@@ -2,14 +2,15 @@
 SVG icons for the Icon Manager UI.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtCore import QByteArray, Qt
 from PyQt6.QtGui import QIcon, QPixmap, QPainter
 from PyQt6.QtSvg import QSvgRenderer
 
 
-def svg_to_icon(svg_content: str, size: int = 16) -> QIcon:
-    """Convert SVG string content to a QIcon."""
-    renderer = QSvgRenderer(QByteArray(svg_content.encode()))
+def _render(renderer: QSvgRenderer, size: int) -> QIcon:
+    """Paint an already parsed SVG into a size x size icon."""
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
     painter = QPainter(pixmap)
@@ -23,96 +24,146 @@ ICON_COLOR_LIGHT = "#2389D7"  # primary_light
 ICON_COLOR_SUCCESS = "#3DB887"  # success
 
 
-# SVG Icons - simple, clean designs
-ICONS = {
+# SVG icon templates - simple, clean designs.
+# {color} and {light} are filled from the palette by build_icons().
+_ICON_TEMPLATES = {
     # Selection icons
-    "select_all": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "select_all": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <rect x="3" y="3" width="18" height="18" rx="2"/>
         <path d="M9 12l2 2 4-4"/>
     </svg>''',
 
-    "select_none": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "select_none": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <rect x="3" y="3" width="18" height="18" rx="2"/>
     </svg>''',
 
-    "android": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="{ICON_COLOR}">
+    "android": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="{color}">
         <path d="M17.6 9.48l1.84-3.18c.16-.31.04-.69-.26-.85-.29-.15-.65-.06-.83.22l-1.88 3.24C14.86 8.32 13.47 8 12 8s-2.86.32-4.47.91L5.65 5.67c-.19-.29-.58-.38-.87-.2-.28.18-.37.54-.22.83L6.4 9.48C3.3 11.25 1.28 14.44 1 18h22c-.28-3.56-2.3-6.75-5.4-8.52zM7 15.25c-.69 0-1.25-.56-1.25-1.25s.56-1.25 1.25-1.25 1.25.56 1.25 1.25-.56 1.25-1.25 1.25zm10 0c-.69 0-1.25-.56-1.25-1.25s.56-1.25 1.25-1.25 1.25.56 1.25 1.25-.56 1.25-1.25 1.25z"/>
     </svg>''',
 
-    "ios": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="{ICON_COLOR}">
+    "ios": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="{color}">
         <path d="M18.71 19.5c-.83 1.24-1.71 2.45-3.05 2.47-1.34.03-1.77-.79-3.29-.79-1.53 0-2 .77-3.27.82-1.31.05-2.3-1.32-3.14-2.53C4.25 17 2.94 12.45 4.7 9.39c.87-1.52 2.43-2.48 4.12-2.51 1.28-.02 2.5.87 3.29.87.78 0 2.26-1.07 3.81-.91.65.03 2.47.26 3.64 1.98-.09.06-2.17 1.28-2.15 3.81.03 3.02 2.65 4.03 2.68 4.04-.03.07-.42 1.44-1.38 2.83M13 3.5c.73-.83 1.94-1.46 2.94-1.5.13 1.17-.34 2.35-1.04 3.19-.69.85-1.83 1.51-2.95 1.42-.15-1.15.41-2.35 1.05-3.11z"/>
     </svg>''',
 
     # Override icons
-    "set_override": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "set_override": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"/>
         <polyline points="17 8 12 3 7 8"/>
         <line x1="12" y1="3" x2="12" y2="15"/>
     </svg>''',
 
-    "clear_override": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "clear_override": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <circle cx="12" cy="12" r="10"/>
         <line x1="15" y1="9" x2="9" y2="15"/>
         <line x1="9" y1="9" x2="15" y2="15"/>
     </svg>''',
 
     # Export/Import icons
-    "export": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "export": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"/>
         <polyline points="7 10 12 15 17 10"/>
         <line x1="12" y1="15" x2="12" y2="3"/>
     </svg>''',
 
-    "export_generated": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "export_generated": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"/>
         <polyline points="7 10 12 15 17 10"/>
         <line x1="12" y1="15" x2="12" y2="3"/>
-        <circle cx="18" cy="5" r="3" fill="{ICON_COLOR_LIGHT}" stroke="none"/>
+        <circle cx="18" cy="5" r="3" fill="{light}" stroke="none"/>
     </svg>''',
 
-    "import": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "import": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"/>
         <polyline points="17 8 12 3 7 8"/>
         <line x1="12" y1="3" x2="12" y2="15"/>
-        <rect x="14" y="1" width="6" height="4" rx="1" fill="{ICON_COLOR}" stroke="none"/>
+        <rect x="14" y="1" width="6" height="4" rx="1" fill="{color}" stroke="none"/>
     </svg>''',
 
     # Action icons
-    "save": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2">
+    "save": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2">
         <path d="M19 21H5a2 2 0 01-2-2V5a2 2 0 012-2h11l5 5v11a2 2 0 01-2 2z"/>
         <polyline points="17 21 17 13 7 13 7 21"/>
         <polyline points="7 3 7 8 15 8"/>
     </svg>''',
 
-    "generate": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2">
+    "generate": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2">
         <polygon points="13 2 3 14 12 14 11 22 21 10 12 10 13 2"/>
     </svg>''',
 
     # Browse icon
-    "browse": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2">
+    "browse": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2">
         <path d="M22 19a2 2 0 01-2 2H4a2 2 0 01-2-2V5a2 2 0 012-2h5l2 3h9a2 2 0 012 2z"/>
     </svg>''',
 
     # Adaptive icon layer icons
-    "foreground": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "foreground": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <rect x="3" y="3" width="18" height="18" rx="2"/>
-        <circle cx="12" cy="12" r="5" fill="{ICON_COLOR_LIGHT}"/>
+        <circle cx="12" cy="12" r="5" fill="{light}"/>
     </svg>''',
 
-    "background": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
-        <rect x="3" y="3" width="18" height="18" rx="2" fill="{ICON_COLOR}" opacity="0.3"/>
-        <circle cx="12" cy="12" r="5" stroke="{ICON_COLOR}" fill="none" stroke-dasharray="2 2"/>
+    "background": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
+        <rect x="3" y="3" width="18" height="18" rx="2" fill="{color}" opacity="0.3"/>
+        <circle cx="12" cy="12" r="5" stroke="{color}" fill="none" stroke-dasharray="2 2"/>
     </svg>''',
 
-    "notification": f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{ICON_COLOR}" stroke-width="2">
+    "notification": '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2">
         <path d="M18 8A6 6 0 006 8c0 7-3 9-3 9h18s-3-2-3-9"/>
         <path d="M13.73 21a2 2 0 01-3.46 0"/>
     </svg>''',
 }
 
 
+@lru_cache(maxsize=None)
+def build_icons(color: str = ICON_COLOR, light: str = ICON_COLOR_LIGHT) -> dict[str, str]:
+    """
+    Fill the icon templates with a palette.
+
+    Cached per (color, light) pair; the returned dict is shared, do not modify it.
+    """
+    return {name: template.format(color=color, light=light) for name, template in _ICON_TEMPLATES.items()}
+
+
+# Encoded once at import; every render reads these bytes directly
+ICONS: dict[str, QByteArray] = {
+    name: QByteArray(svg.encode('utf-8')) for name, svg in build_icons().items()
+}
+
+
+# Rendered icons keyed by (name, size); QIcon copies share the pixmap data
+_ICON_CACHE: dict[tuple[str, int], QIcon] = {}
+
+# Parsed SVGs keyed by name, shared by every size of the same icon
+_RENDERER_CACHE: dict[str, QSvgRenderer] = {}
+
+
+def _get_renderer(name: str) -> QSvgRenderer:
+    """Get the parsed SVG for an icon, parsing it on first use."""
+    renderer = _RENDERER_CACHE.get(name)
+    if renderer is None:
+        renderer = _RENDERER_CACHE[name] = QSvgRenderer(ICONS[name])
+    return renderer
+
+
 def get_icon(name: str, size: int = 16) -> QIcon:
-    """Get a QIcon by name."""
+    """Get a QIcon by name, rendering it only the first time per size."""
+    key = (name, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
     if name not in ICONS:
         return QIcon()
-    return svg_to_icon(ICONS[name], size)
+    icon = _render(_get_renderer(name), size)
+    _ICON_CACHE[key] = icon
+    return icon
+
+
+def prebuild_icons(sizes: tuple[int, ...] = (14, 16, 18)) -> None:
+    """
+    Render every icon at the given sizes up front.
+
+    The defaults are the sizes the Icon Manager windows ask for, so later
+    get_icon calls are plain cache lookups.
+    """
+    for name in ICONS:
+        for size in sizes:
+            get_icon(name, size)
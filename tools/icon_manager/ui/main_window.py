@@ -3,65 +3,91 @@ Main window for the Icon Manager application.
 """
 
 import json
+import os
 import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QFileDialog, QTableWidget, QTableWidgetItem,
+    QPushButton, QLabel, QFileDialog, QTableView,
     QMessageBox, QProgressDialog, QHeaderView,
-    QAbstractItemView, QCheckBox, QMenu, QApplication, QTabWidget,
+    QAbstractItemView, QMenu, QTabWidget,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QImage, QColor, QIcon, QAction
-from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtCore import Qt, QEventLoop, QSortFilterProxyModel, QThreadPool
+from PyQt6.QtGui import QImage, QAction
 
 from ..core import (
-    COLORS, PROJECT_ROOT, CONFIG_PATH,
+    COLORS, PROJECT_ROOT, CONFIG_PATH, BOUNDS_CACHE_PATH,
     ANDROID_RES_DIR, IOS_ASSETS_DIR, ASSETS_ANDROID_DIR, ASSETS_IOS_DIR,
     MIPMAP_SIZES, ADAPTIVE_ICON_SIZES, ANDROID_LEGACY_ICONS, ANDROID_ADAPTIVE_ICONS,
-    IconTarget, IconBounds, Config,
-)
-from ..rendering import (
-    get_image_bounds, get_svg_content_bounds, load_icon_preview,
-    render_svg_cropped, render_png_to_bounds,
+    IconTarget, IconBounds, Config, BoundsCache, RenderHashCache, RENDER_HASH_CACHE_PATH,
 )
+from ..rendering import get_image_bounds, load_svg_source
 from .widgets import SvgInputWidget, ComparisonWidget
 from .adaptive_tab import AdaptiveIconTab
-from .icons import get_icon
+from .icons import get_icon, prebuild_icons
+from .target_model import IconTargetModel
+from .workers import ProgressTask, RenderTargetTask
+
 
+def _load_bounds(path: Path) -> IconBounds | None:
+    """Decode an icon and find its content bounds; safe off the GUI thread."""
+    img = QImage(str(path))
+    return get_image_bounds(img) if not img.isNull() else None
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    """Table widget item that sorts numerically based on UserRole data."""
 
-    def __lt__(self, other: QTableWidgetItem) -> bool:
-        my_value = self.data(Qt.ItemDataRole.UserRole)
-        other_value = other.data(Qt.ItemDataRole.UserRole)
-        if my_value is not None and other_value is not None:
-            return my_value < other_value
-        return super().__lt__(other)
+def _make_parent_dirs(paths: Iterable[Path]) -> dict[Path, OSError]:
+    """
+    Create the parent directory of each path, once per unique directory.
+
+    Returns:
+        The error for each directory that could not be created.
+    """
+    errors: dict[Path, OSError] = {}
+    for parent in {path.parent for path in paths}:
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            errors[parent] = e
+    return errors
 
 
 class IconManagerWindow(QMainWindow):
     """Main window for the Icon Manager tool."""
 
     # Column indices
-    COL_CHECK = 0
-    COL_PREVIEW = 1
-    COL_NAME = 2
-    COL_SIZE = 3
-    COL_OVERRIDE = 4
-    COL_PATH = 5
+    COL_CHECK = IconTargetModel.COL_CHECK
+    COL_PREVIEW = IconTargetModel.COL_PREVIEW
+    COL_NAME = IconTargetModel.COL_NAME
+    COL_SIZE = IconTargetModel.COL_SIZE
+    COL_OVERRIDE = IconTargetModel.COL_OVERRIDE
+    COL_PATH = IconTargetModel.COL_PATH
 
     def __init__(self):
         super().__init__()
         self.targets: list[IconTarget] = []
         self.config = Config.load(CONFIG_PATH)
+        self.bounds_cache = BoundsCache.load(BOUNDS_CACHE_PATH)
+        self.render_hashes = RenderHashCache.load(RENDER_HASH_CACHE_PATH)
+        # Icon files whose content bounds have not been decoded yet
+        self._unmeasured: set[Path] = set()
+        prebuild_icons()
         self._init_ui()
         self._scan_targets()
         self._apply_config()
 
+    def closeEvent(self, event):
+        try:
+            self.bounds_cache.save(BOUNDS_CACHE_PATH)
+            self.render_hashes.save(RENDER_HASH_CACHE_PATH)
+        except OSError:
+            pass  # The caches are only an optimization
+        super().closeEvent(event)
+
     def _init_ui(self):
         self.setWindowTitle("Mattermost Icon Manager")
         self.setMinimumSize(1100, 700)
@@ -145,17 +171,23 @@ class IconManagerWindow(QMainWindow):
 
         right_panel.addLayout(header)
 
-        # Table widget
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["", "Preview", "Icon", "Size", "Override SVG", "Path"])
+        # Table view over the targets model; the proxy sorts by SORT_ROLE
+        self.model = IconTargetModel(self.targets, self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(IconTargetModel.SORT_ROLE)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(48)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.table.setSortingEnabled(True)
         self.table.sortByColumn(self.COL_PATH, Qt.SortOrder.AscendingOrder)
 
@@ -261,9 +293,6 @@ class IconManagerWindow(QMainWindow):
 
     def _scan_targets(self):
         """Scan project directories for icon targets."""
-        self.targets.clear()
-        self.table.setRowCount(0)
-
         categories = [
             ("android", ANDROID_RES_DIR),
             ("ios", IOS_ASSETS_DIR),
@@ -271,18 +300,62 @@ class IconManagerWindow(QMainWindow):
             ("assets_ios", ASSETS_IOS_DIR),
         ]
 
+        # Collect (path, name, size, category) first, then decode in parallel
+        found = []
         for cat_id, base_path in categories:
             if not base_path.exists():
                 continue
             if "android" in cat_id:
-                self._scan_android(base_path, cat_id)
+                icons = self._scan_android(base_path)
             else:
-                self._scan_ios(base_path, cat_id)
+                icons = self._scan_ios(base_path)
+            found.extend((path, name, size, cat_id) for path, name, size in icons)
+
+        # Reuse bounds of unchanged files; the rest are only decoded once a
+        # target is shown or rendered (see _ensure_bounds)
+        all_bounds = [self.bounds_cache.get(path, path.stat().st_mtime_ns) for path, _, _, _ in found]
+        self._unmeasured = {found[i][0] for i, bounds in enumerate(all_bounds) if bounds is None}
+
+        # Fill the table with one model reset rather than a row at a time
+        self.model.set_targets([
+            IconTarget(
+                name=name,
+                width=size,
+                height=size,
+                path=path,
+                category=category,
+                bounds=bounds
+            )
+            for (path, name, size, category), bounds in zip(found, all_bounds)
+        ])
 
         self.status_label.setText(f"Found {len(self.targets)} icon targets")
 
-    def _scan_android(self, base_path: Path, category: str):
-        """Scan Android mipmap directories."""
+    def _ensure_bounds(self, targets: list[IconTarget]) -> None:
+        """
+        Measure content bounds of targets the scan left unmeasured.
+
+        Each file is decoded at most once per scan, in parallel, and the
+        result is stored in the bounds cache for the next run.
+        """
+        paths = list({target.path for target in targets if target.path in self._unmeasured})
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            measured = dict(zip(paths, pool.map(_load_bounds, paths)))
+        for path, bounds in measured.items():
+            self._unmeasured.discard(path)
+            if bounds is not None:
+                self.bounds_cache.put(path, path.stat().st_mtime_ns, bounds)
+        # Several targets can share one file
+        for target in self.targets:
+            if target.path in measured:
+                target.bounds = measured[target.path]
+
+    def _scan_android(self, base_path: Path) -> list[tuple[Path, str, int]]:
+        """Scan Android mipmap directories for (path, name, size) entries."""
+        icons = []
+
         # Scan legacy launcher icons (48dp base)
         for mipmap_dir, size in MIPMAP_SIZES.items():
             mipmap_path = base_path / mipmap_dir
@@ -291,7 +364,7 @@ class IconManagerWindow(QMainWindow):
             for icon_file in ANDROID_LEGACY_ICONS:
                 icon_path = mipmap_path / icon_file
                 if icon_path.exists():
-                    self._add_icon(icon_path, icon_file, size, category)
+                    icons.append((icon_path, icon_file, size))
 
         # Scan adaptive icon layers (108dp base)
         for mipmap_dir, size in ADAPTIVE_ICON_SIZES.items():
@@ -301,10 +374,12 @@ class IconManagerWindow(QMainWindow):
             for icon_file in ANDROID_ADAPTIVE_ICONS:
                 icon_path = mipmap_path / icon_file
                 if icon_path.exists():
-                    self._add_icon(icon_path, icon_file, size, category)
+                    icons.append((icon_path, icon_file, size))
+
+        return icons
 
-    def _scan_ios(self, base_path: Path, category: str):
-        """Scan iOS appiconset directory."""
+    def _scan_ios(self, base_path: Path) -> list[tuple[Path, str, int]]:
+        """Scan iOS appiconset directory for (path, name, size) entries."""
         contents_path = base_path / "Contents.json"
         icons = []
 
@@ -331,70 +406,34 @@ class IconManagerWindow(QMainWindow):
                     icons.append((icon_path.name, img.width(), icon_path))
 
         icons.sort(key=lambda x: (x[1], x[0]))
-        for filename, size, icon_path in icons:
-            self._add_icon(icon_path, filename, size, category)
-
-    def _add_icon(self, path: Path, name: str, size: int, category: str):
-        """Add an icon to the table."""
-        img = QImage(str(path))
-        bounds = get_image_bounds(img) if not img.isNull() else None
-
-        target = IconTarget(
-            name=name,
-            width=size,
-            height=size,
-            path=path,
-            category=category,
-            bounds=bounds
-        )
-        self.targets.append(target)
-
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        # Checkbox
-        check = QCheckBox()
-        check.setChecked(True)
-        check_widget = QWidget()
-        check_layout = QHBoxLayout(check_widget)
-        check_layout.addWidget(check)
-        check_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        check_layout.setContentsMargins(0, 0, 0, 0)
-        self.table.setCellWidget(row, self.COL_CHECK, check_widget)
-
-        # Preview
-        preview = load_icon_preview(path, 40)
-        preview_item = QTableWidgetItem()
-        preview_item.setIcon(QIcon(preview))
-        preview_item.setFlags(preview_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.table.setItem(row, self.COL_PREVIEW, preview_item)
-
-        # Name
-        name_item = QTableWidgetItem(name)
-        name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        name_item.setData(Qt.ItemDataRole.UserRole, len(self.targets) - 1)
-        self.table.setItem(row, self.COL_NAME, name_item)
-
-        # Size (use NumericTableWidgetItem for proper numeric sorting)
-        size_item = NumericTableWidgetItem()
-        size_item.setText(f"{size}×{size}")
-        size_item.setData(Qt.ItemDataRole.UserRole, size)
-        size_item.setFlags(size_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.table.setItem(row, self.COL_SIZE, size_item)
-
-        # Override
-        override_item = QTableWidgetItem("—")
-        override_item.setFlags(override_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        override_item.setForeground(QColor(COLORS['text_disabled']))
-        self.table.setItem(row, self.COL_OVERRIDE, override_item)
-
-        # Path
-        path_item = QTableWidgetItem(target.rel_path)
-        path_item.setFlags(path_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        path_item.setForeground(QColor(COLORS['text_secondary']))
-        self.table.setItem(row, self.COL_PATH, path_item)
-
-        self.table.setRowHeight(row, 48)
+        return [(icon_path, filename, size) for filename, size, icon_path in icons]
+
+    def _source_rows(self) -> list[int]:
+        """Get model rows in the order the table currently shows them."""
+        return [
+            self.proxy.mapToSource(self.proxy.index(row, 0)).row()
+            for row in range(self.proxy.rowCount())
+        ]
+
+    def _selected_source_rows(self) -> list[int]:
+        """Get model rows of the selected table rows."""
+        return [
+            self.proxy.mapToSource(index).row()
+            for index in self.table.selectionModel().selectedRows()
+        ]
+
+    def _refresh_previews(self, rel_paths: set[str] | None = None):
+        """
+        Reload preview icons from disk as rows are painted.
+
+        With rel_paths, only the rows for those files are refreshed.
+        """
+        if rel_paths is None:
+            self.model.reload_previews()
+        else:
+            self.model.reload_previews(
+                row for row, target in enumerate(self.targets) if target.rel_path in rel_paths
+            )
 
     def _apply_config(self):
         """Apply saved config to targets."""
@@ -407,36 +446,26 @@ class IconManagerWindow(QMainWindow):
 
         disabled_set = set(self.config.disabled)
 
-        # Iterate over table rows (handles sorting)
-        for row in range(self.table.rowCount()):
-            idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-            if idx is None:
-                continue
-            target = self.targets[idx]
+        for row, target in enumerate(self.targets):
             rel_path = target.rel_path
 
             # Apply disabled state
             if rel_path in disabled_set:
-                widget = self.table.cellWidget(row, self.COL_CHECK)
-                if widget:
-                    widget.findChild(QCheckBox).setChecked(False)
+                self.model.set_checked(row, False)
 
             # Apply overrides
             if rel_path in self.config.overrides:
                 override_path = Path(self.config.overrides[rel_path])
                 if override_path.exists():
                     target.override_path = override_path
-                    self.table.item(row, self.COL_OVERRIDE).setText(override_path.name)
-                    self.table.item(row, self.COL_OVERRIDE).setForeground(QColor(COLORS['primary_light']))
-                    self.table.item(row, self.COL_OVERRIDE).setToolTip(str(override_path))
+                    self.model.target_changed(row)
 
     def _on_selection_changed(self):
-        rows = self.table.selectionModel().selectedRows()
+        rows = self._selected_source_rows()
         if len(rows) == 1:
-            idx = self.table.item(rows[0].row(), self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-            if idx is not None:
-                target = self.targets[idx]
-                self.comparison.set_current(target)
+            target = self.targets[rows[0]]
+            self._ensure_bounds([target])
+            self.comparison.set_current(target)
 
     def _show_context_menu(self, pos):
         menu = QMenu(self)
@@ -476,7 +505,7 @@ class IconManagerWindow(QMainWindow):
                 QMessageBox.warning(self, "Invalid SVG", "Could not load the selected SVG file.")
 
     def _set_override(self):
-        rows = self.table.selectionModel().selectedRows()
+        rows = self._selected_source_rows()
         if not rows:
             QMessageBox.information(self, "No Selection", "Select one or more icons first.")
             return
@@ -499,37 +528,26 @@ class IconManagerWindow(QMainWindow):
                 QMessageBox.warning(self, "Invalid PNG", "Could not load the selected PNG file.")
                 return
         else:
-            renderer = QSvgRenderer(str(override_path))
-            if not renderer.isValid():
+            if load_svg_source(override_path) is None:
                 QMessageBox.warning(self, "Invalid SVG", "Could not load the selected SVG file.")
                 return
 
-        for row_idx in rows:
-            row = row_idx.row()
-            idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-            if idx is not None:
-                self.targets[idx].override_path = override_path
-                self.table.item(row, self.COL_OVERRIDE).setText(override_path.name)
-                self.table.item(row, self.COL_OVERRIDE).setForeground(QColor(COLORS['primary_light']))
-                self.table.item(row, self.COL_OVERRIDE).setToolTip(str(override_path))
+        for row in rows:
+            self.targets[row].override_path = override_path
+            self.model.target_changed(row)
 
         # Refresh the preview (including info label)
         self._on_selection_changed()
         self.status_label.setText(f"Set override for {len(rows)} icon(s)")
 
     def _clear_override(self):
-        rows = self.table.selectionModel().selectedRows()
+        rows = self._selected_source_rows()
         if not rows:
             return
 
-        for row_idx in rows:
-            row = row_idx.row()
-            idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-            if idx is not None:
-                self.targets[idx].override_path = None
-                self.table.item(row, self.COL_OVERRIDE).setText("—")
-                self.table.item(row, self.COL_OVERRIDE).setForeground(QColor(COLORS['text_disabled']))
-                self.table.item(row, self.COL_OVERRIDE).setToolTip("")
+        for row in rows:
+            self.targets[row].override_path = None
+            self.model.target_changed(row)
 
         # Refresh the preview (including info label)
         self._on_selection_changed()
@@ -540,19 +558,15 @@ class IconManagerWindow(QMainWindow):
         self.config.overrides = {}
         self.config.disabled = []
 
-        # Iterate over table rows to get current sort order
-        for row in range(self.table.rowCount()):
-            idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-            if idx is None:
-                continue
-            target = self.targets[idx]
+        # Iterate in table order to get current sort order
+        for row in self._source_rows():
+            target = self.targets[row]
 
             if target.override_path:
                 self.config.overrides[target.rel_path] = str(target.override_path)
 
             # Save disabled state (unchecked rows)
-            widget = self.table.cellWidget(row, self.COL_CHECK)
-            if widget and not widget.findChild(QCheckBox).isChecked():
+            if not self.model.is_checked(row):
                 self.config.disabled.append(target.rel_path)
 
         self.config.save(CONFIG_PATH)
@@ -584,27 +598,26 @@ class IconManagerWindow(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
 
-        exported = 0
-        for i, target in enumerate(selected):
-            if progress.wasCanceled():
-                break
-
-            progress.setValue(i)
-            QApplication.processEvents()
-
-            rel_parts = Path(target.rel_path).parts
-            safe_name = "_".join(rel_parts).replace("\\", "_").replace("/", "_")
-            if not safe_name.endswith(".png"):
-                safe_name = safe_name.replace(".png", "") + ".png"
-
-            dest_file = export_path / safe_name
+        def copy_selected(progress, is_cancelled) -> tuple[int, list[str]]:
+            copied = 0
+            errors = []
+            for done, target in enumerate(selected, 1):
+                if is_cancelled():
+                    break
+                safe_name = target.safe_export_name
+                try:
+                    shutil.copy2(target.path, export_path / safe_name)
+                    manifest["icons"][safe_name] = target.rel_path
+                    copied += 1
+                except Exception as e:
+                    errors.append(f"Failed to export {target.name}: {e}")
+                finally:
+                    progress(done)
+            return copied, errors
 
-            try:
-                shutil.copy2(target.path, dest_file)
-                manifest["icons"][safe_name] = target.rel_path
-                exported += 1
-            except Exception as e:
-                QMessageBox.warning(self, "Export Error", f"Failed to export {target.name}: {e}")
+        exported, errors = self._run_with_progress(copy_selected, progress)
+        for error in errors:
+            QMessageBox.warning(self, "Export Error", error)
 
         progress.setValue(len(selected))
 
@@ -657,49 +670,13 @@ class IconManagerWindow(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
 
-        svg_cache: dict[Path, tuple[QSvgRenderer, IconBounds]] = {}
+        jobs = [(target, export_path / target.safe_export_name, target.name) for target in selected]
 
-        def get_svg_data(svg_path: Path) -> tuple[QSvgRenderer, IconBounds]:
-            if svg_path not in svg_cache:
-                renderer = QSvgRenderer(str(svg_path))
-                bounds = get_svg_content_bounds(renderer)
-                svg_cache[svg_path] = (renderer, bounds)
-            return svg_cache[svg_path]
-
-        exported = 0
-        errors = []
-
-        for i, target in enumerate(selected):
-            if progress.wasCanceled():
-                break
-
-            progress.setValue(i)
-            progress.setLabelText(f"Generating {target.name}...")
-            QApplication.processEvents()
-
-            rel_parts = Path(target.rel_path).parts
-            safe_name = "_".join(rel_parts).replace("\\", "_").replace("/", "_")
-            if not safe_name.endswith(".png"):
-                safe_name = safe_name.replace(".png", "") + ".png"
-
-            dest_file = export_path / safe_name
-
-            try:
-                if target.override_is_png:
-                    source = QImage(str(target.override_path))
-                    image = render_png_to_bounds(source, target)
-                else:
-                    svg_path = target.override_path or self.svg_input.svg_path
-                    renderer, svg_bounds = get_svg_data(svg_path)
-                    image = render_svg_cropped(renderer, target, svg_bounds)
-
-                if not image.save(str(dest_file), "PNG"):
-                    errors.append(f"Failed to save: {target.name}")
-                else:
-                    manifest["icons"][safe_name] = target.rel_path
-                    exported += 1
-            except Exception as e:
-                errors.append(f"{target.name}: {e}")
+        saved, errors = self._render_targets(jobs, progress)
+        for i in saved:
+            target, dest_file, _ = jobs[i]
+            manifest["icons"][dest_file.name] = target.rel_path
+        exported = len(saved)
 
         progress.setValue(len(selected))
 
@@ -725,6 +702,120 @@ class IconManagerWindow(QMainWindow):
 
         self.status_label.setText(f"Generated and exported {exported} icons")
 
+    def _render_targets(
+        self,
+        jobs: list[tuple[IconTarget, Path, str]],
+        progress: QProgressDialog,
+        hash_cache: RenderHashCache | None = None
+    ) -> tuple[list[int], list[str]]:
+        """
+        Render and save (target, dest_path, label) jobs on the thread pool.
+
+        Each SVG source is read and measured on the GUI thread, at most once
+        per file version (see load_svg_source); the workers render and
+        encode in parallel while a local event loop keeps the progress
+        dialog responsive. Jobs writing the same file run one after another
+        in job order, so the last one wins as in a serial loop. Cancelling
+        skips jobs that have not started yet. With hash_cache, files whose
+        new render matches what was last written there are left untouched.
+
+        Returns:
+            Tuple of (indices of saved jobs in job order, error messages).
+        """
+        self._ensure_bounds([target for target, _, _ in jobs])
+
+        saved: list[int] = []
+        errors: list[str] = []
+        cancelled = threading.Event()
+        progress.canceled.connect(cancelled.set)
+        loop = QEventLoop()
+        pending = 0
+        done = 0
+
+        # Tasks waiting for an earlier job with the same destination
+        queued: dict[Path, list[RenderTargetTask]] = {}
+
+        def on_finished(index: int, ok: bool, error: str, digest: str):
+            nonlocal done
+            done += 1
+            dest_path = jobs[index][1]
+            if ok:
+                saved.append(index)
+                if digest and hash_cache is not None:
+                    # Record before the next job for this file starts
+                    try:
+                        hash_cache.put(dest_path, dest_path.stat().st_mtime_ns, digest)
+                    except OSError:
+                        pass
+            elif error:
+                errors.append(error)
+            waiting = queued.get(dest_path)
+            if waiting:
+                QThreadPool.globalInstance().start(waiting.pop(0))
+            progress.setValue(done)
+            if done == pending:
+                loop.quit()
+
+        parent_errors = _make_parent_dirs(dest_path for _, dest_path, _ in jobs)
+
+        tasks = []
+        first_tasks = []
+        for i, (target, dest_path, label) in enumerate(jobs):
+            if dest_path.parent in parent_errors:
+                errors.append(f"{label}: {parent_errors[dest_path.parent]}")
+                continue
+            svg_data = svg_bounds = None
+            if not target.override_is_png:
+                svg_path = target.override_path or self.svg_input.svg_path
+                loaded = load_svg_source(svg_path)
+                if loaded is None:
+                    errors.append(f"{label}: Could not load SVG {svg_path}")
+                    continue
+                svg_data, _, svg_bounds = loaded
+            task = RenderTargetTask(i, target, dest_path, label, svg_data, svg_bounds, cancelled, hash_cache)
+            task.signals.finished.connect(on_finished)
+            tasks.append(task)
+            if dest_path in queued:
+                queued[dest_path].append(task)
+            else:
+                queued[dest_path] = []
+                first_tasks.append(task)
+
+        pending = len(tasks)
+        for task in first_tasks:
+            QThreadPool.globalInstance().start(task)
+        if pending:
+            loop.exec()
+
+        saved.sort()
+        return saved, errors
+
+    def _run_with_progress(
+        self, func: Callable[..., tuple[int, list[str]]], progress: QProgressDialog
+    ) -> tuple[int, list[str]]:
+        """
+        Run func on the thread pool and wait for its (count, errors) result.
+
+        func receives the same ``progress`` and ``is_cancelled`` callbacks
+        as the layer replacement functions. Its progress drives the dialog
+        through queued signals and cancelling the dialog asks it to stop;
+        a local event loop keeps the window painting meanwhile.
+        """
+        task = ProgressTask(func)
+        result: list[tuple[int, list[str]]] = []
+        loop = QEventLoop()
+
+        def on_finished(count: int, errors: list[str]):
+            result.append((count, errors))
+            loop.quit()
+
+        task.signals.progress.connect(progress.setValue)
+        task.signals.finished.connect(on_finished)
+        progress.canceled.connect(task.cancel)
+        QThreadPool.globalInstance().start(task)
+        loop.exec()
+        return result[0]
+
     def _import_icons(self):
         """Import icons from a ZIP file using the manifest."""
         zip_path, _ = QFileDialog.getOpenFileName(
@@ -739,13 +830,17 @@ class IconManagerWindow(QMainWindow):
         try:
             with zipfile.ZipFile(zip_path, 'r') as zf:
                 manifest_data = None
-                manifest_name = None
+                names = zf.namelist()
+                zip_names = set(names)
 
-                for name in zf.namelist():
-                    if name.endswith("manifest.json"):
-                        manifest_name = name
-                        manifest_data = json.loads(zf.read(name).decode('utf-8'))
-                        break
+                # A manifest at the root is a set lookup; otherwise take the
+                # first one inside a folder, as exported folders are zipped
+                if "manifest.json" in zip_names:
+                    manifest_name = "manifest.json"
+                else:
+                    manifest_name = next((n for n in names if n.endswith("/manifest.json")), None)
+                if manifest_name:
+                    manifest_data = json.loads(zf.read(manifest_name).decode('utf-8'))
 
                 if not manifest_data:
                     QMessageBox.warning(
@@ -767,7 +862,7 @@ class IconManagerWindow(QMainWindow):
                 found_icons = []
                 for exported_name, rel_path in icons_map.items():
                     zip_name = prefix + exported_name
-                    if zip_name in zf.namelist():
+                    if zip_name in zip_names:
                         target_path = PROJECT_ROOT / rel_path
                         found_icons.append((zip_name, target_path, rel_path))
 
@@ -788,33 +883,34 @@ class IconManagerWindow(QMainWindow):
                 progress.setWindowModality(Qt.WindowModality.WindowModal)
                 progress.setMinimumDuration(0)
 
-                imported = 0
-                errors = []
-
-                for i, (zip_name, target_path, rel_path) in enumerate(found_icons):
-                    if progress.wasCanceled():
-                        break
-
-                    progress.setValue(i)
-                    QApplication.processEvents()
-
-                    try:
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        with zf.open(zip_name) as src, open(target_path, 'wb') as dst:
-                            dst.write(src.read())
-                        imported += 1
-                    except Exception as e:
-                        errors.append(f"{rel_path}: {e}")
+                imported_rel_paths = set()
+
+                def extract_found(progress, is_cancelled) -> tuple[int, list[str]]:
+                    extracted = 0
+                    errors = []
+                    parent_errors = _make_parent_dirs(target_path for _, target_path, _ in found_icons)
+                    for done, (zip_name, target_path, rel_path) in enumerate(found_icons, 1):
+                        if is_cancelled():
+                            break
+                        try:
+                            if target_path.parent in parent_errors:
+                                raise parent_errors[target_path.parent]
+                            with zf.open(zip_name) as src, open(target_path, 'wb') as dst:
+                                shutil.copyfileobj(src, dst, 1 << 20)
+                            extracted += 1
+                            imported_rel_paths.add(rel_path)
+                        except Exception as e:
+                            errors.append(f"{rel_path}: {e}")
+                        finally:
+                            progress(done)
+                    return extracted, errors
+
+                imported, errors = self._run_with_progress(extract_found, progress)
 
                 progress.setValue(len(found_icons))
 
-                # Refresh table previews
-                for row in range(self.table.rowCount()):
-                    idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-                    if idx is not None:
-                        target = self.targets[idx]
-                        preview = load_icon_preview(target.path, 40)
-                        self.table.item(row, self.COL_PREVIEW).setIcon(QIcon(preview))
+                # Refresh previews of the replaced files only
+                self._refresh_previews(imported_rel_paths)
 
                 self.comparison.set_current(None)
 
@@ -837,35 +933,16 @@ class IconManagerWindow(QMainWindow):
             QMessageBox.warning(self, "Import Error", f"Failed to import: {e}")
 
     def _select_all(self):
-        for row in range(self.table.rowCount()):
-            widget = self.table.cellWidget(row, self.COL_CHECK)
-            if widget:
-                widget.findChild(QCheckBox).setChecked(True)
+        self.model.check_where(lambda target: True)
 
     def _select_none(self):
-        for row in range(self.table.rowCount()):
-            widget = self.table.cellWidget(row, self.COL_CHECK)
-            if widget:
-                widget.findChild(QCheckBox).setChecked(False)
+        self.model.check_where(lambda target: False)
 
     def _select_category(self, category: str):
-        for row in range(self.table.rowCount()):
-            idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-            if idx is not None:
-                target = self.targets[idx]
-                widget = self.table.cellWidget(row, self.COL_CHECK)
-                if widget:
-                    widget.findChild(QCheckBox).setChecked(category in target.category)
+        self.model.check_where(lambda target: category in target.category)
 
     def _get_selected_targets(self) -> list[IconTarget]:
-        selected = []
-        for row in range(self.table.rowCount()):
-            widget = self.table.cellWidget(row, self.COL_CHECK)
-            if widget and widget.findChild(QCheckBox).isChecked():
-                idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-                if idx is not None:
-                    selected.append(self.targets[idx])
-        return selected
+        return [self.targets[row] for row in self._source_rows() if self.model.is_checked(row)]
 
     def _generate_icons(self):
         selected = self._get_selected_targets()
@@ -880,9 +957,14 @@ class IconManagerWindow(QMainWindow):
                 "Please set a default SVG or assign overrides to all selected icons.")
             return
 
-        android_count = sum(1 for t in selected if "android" in t.category)
-        ios_count = sum(1 for t in selected if "ios" in t.category)
-        override_count = sum(1 for t in selected if t.override_path)
+        android_count = ios_count = override_count = 0
+        for t in selected:
+            if "android" in t.category:
+                android_count += 1
+            elif "ios" in t.category:
+                ios_count += 1
+            if t.override_path:
+                override_count += 1
 
         reply = QMessageBox.question(
             self, "Confirm Replace",
@@ -901,62 +983,27 @@ class IconManagerWindow(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
 
-        svg_cache: dict[Path, tuple[QSvgRenderer, IconBounds]] = {}
-
-        def get_svg_data(svg_path: Path) -> tuple[QSvgRenderer, IconBounds]:
-            if svg_path not in svg_cache:
-                renderer = QSvgRenderer(str(svg_path))
-                bounds = get_svg_content_bounds(renderer)
-                svg_cache[svg_path] = (renderer, bounds)
-            return svg_cache[svg_path]
-
-        errors = []
-
-        for i, target in enumerate(selected):
-            if progress.wasCanceled():
-                break
-
-            progress.setValue(i)
-            progress.setLabelText(f"Generating {target.name}...")
-            QApplication.processEvents()
-
-            try:
-                if target.override_is_png:
-                    source = QImage(str(target.override_path))
-                    image = render_png_to_bounds(source, target)
-                else:
-                    svg_path = target.override_path or self.svg_input.svg_path
-                    renderer, svg_bounds = get_svg_data(svg_path)
-                    image = render_svg_cropped(renderer, target, svg_bounds)
-
-                target.path.parent.mkdir(parents=True, exist_ok=True)
-
-                if not image.save(str(target.path), "PNG"):
-                    errors.append(f"Failed to save: {target.path}")
-            except Exception as e:
-                errors.append(f"{target.path}: {e}")
+        # Each target is written in place; its path doubles as the error label
+        jobs = [(target, target.path, str(target.path)) for target in selected]
+        saved, errors = self._render_targets(jobs, progress, self.render_hashes)
+        generated = len(saved)
 
         progress.setValue(len(selected))
 
-        # Refresh table previews
-        for row in range(self.table.rowCount()):
-            idx = self.table.item(row, self.COL_NAME).data(Qt.ItemDataRole.UserRole)
-            if idx is not None:
-                target = self.targets[idx]
-                preview = load_icon_preview(target.path, 40)
-                self.table.item(row, self.COL_PREVIEW).setIcon(QIcon(preview))
+        # Refresh previews of the rewritten files only
+        self._refresh_previews({selected[i].rel_path for i in saved})
 
         self.comparison.set_current(None)
 
         if errors:
             QMessageBox.warning(
                 self, "Completed with Errors",
-                f"Generated {len(selected) - len(errors)} icons.\n\nErrors:\n" + "\n".join(errors[:10])
+                f"Generated {generated} icons.\n\nErrors:\n" + "\n".join(errors[:10])
             )
         else:
             QMessageBox.information(
                 self, "Success",
-                f"Successfully generated and replaced {len(selected)} icons!"
+                f"Successfully generated and replaced {generated} icons!"
             )
 
-        self.status_label.setText(f"Generated {len(selected) - len(errors)}/{len(selected)} icons")
+        self.status_label.setText(f"Generated {generated}/{len(selected)} icons")
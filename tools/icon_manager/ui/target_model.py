@@ -0,0 +1,221 @@
+"""
+Table model for the icon targets list.
+"""
+
+import os
+from typing import Any, Callable, Iterable
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QThreadPool, pyqtSlot
+from PyQt6.QtGui import QColor, QIcon, QImage, QPixmap, QPixmapCache
+
+from ..core import COLORS, IconTarget
+from ..rendering import load_icon_preview_image, preview_cache_key
+from .workers import PreviewLoadTask
+
+
+# Text colors shared by every row
+_OVERRIDE_SET_COLOR = QColor(COLORS['primary_light'])
+_OVERRIDE_UNSET_COLOR = QColor(COLORS['text_disabled'])
+_PATH_COLOR = QColor(COLORS['text_secondary'])
+
+
+class IconTargetModel(QAbstractTableModel):
+    """
+    Model over the icon targets found by the main window.
+
+    Rows map one-to-one to the shared targets list; the view only asks for
+    the rows it paints. Check state lives in the model, so no per-row
+    widgets are needed. Preview icons are loaded on the thread pool the
+    first time a row is painted and kept in QPixmapCache, keyed by file
+    mtime so rewritten icons reload and unchanged ones do not.
+    """
+
+    # Column indices
+    COL_CHECK = 0
+    COL_PREVIEW = 1
+    COL_NAME = 2
+    COL_SIZE = 3
+    COL_OVERRIDE = 4
+    COL_PATH = 5
+
+    HEADERS = ["", "Preview", "Icon", "Size", "Override SVG", "Path"]
+
+    # Role holding the value a column sorts by (numeric for sizes)
+    SORT_ROLE = Qt.ItemDataRole.UserRole
+
+    PREVIEW_SIZE = 40
+
+    def __init__(self, targets: list[IconTarget], parent=None):
+        super().__init__(parent)
+        self._targets = targets
+        self._checked: list[bool] = [True] * len(targets)
+        # Several targets can share one file (e.g. iOS idioms)
+        self._rows_by_path: dict[str, list[int]] = {}
+        self._index_paths()
+        # Current cache key per path; cleared by reload_previews() so files
+        # are stat'ed again
+        self._preview_keys: dict[str, str] = {}
+        # In-flight loads by cache key; holding the task keeps its signals
+        # alive until the result arrives
+        self._preview_tasks: dict[str, PreviewLoadTask] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._targets)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.COL_CHECK:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        target = self._targets[row]
+
+        if col == self.COL_CHECK:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if self._checked[row] else Qt.CheckState.Unchecked
+            if role == self.SORT_ROLE:
+                return int(self._checked[row])
+        elif col == self.COL_PREVIEW:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._preview(str(target.path))
+        elif col == self.COL_NAME:
+            if role in (Qt.ItemDataRole.DisplayRole, self.SORT_ROLE):
+                return target.name
+        elif col == self.COL_SIZE:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"{target.width}×{target.height}"
+            if role == self.SORT_ROLE:
+                return target.width
+        elif col == self.COL_OVERRIDE:
+            override = target.override_path
+            if role in (Qt.ItemDataRole.DisplayRole, self.SORT_ROLE):
+                return override.name if override else "—"
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return _OVERRIDE_SET_COLOR if override else _OVERRIDE_UNSET_COLOR
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return str(override) if override else ""
+        elif col == self.COL_PATH:
+            if role in (Qt.ItemDataRole.DisplayRole, self.SORT_ROLE):
+                return target.rel_path
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return _PATH_COLOR
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != self.COL_CHECK or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        self._checked[index.row()] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def target(self, row: int) -> IconTarget:
+        """Get the target shown in a model row."""
+        return self._targets[row]
+
+    def set_targets(self, targets: list[IconTarget]) -> None:
+        """
+        Replace all targets, checked, with a single model reset.
+
+        The shared targets list is updated in place, so the view lays out
+        once however many rows there are.
+        """
+        self.beginResetModel()
+        self._targets[:] = targets
+        self._checked = [True] * len(self._targets)
+        self._index_paths()
+        self.endResetModel()
+
+    def _index_paths(self) -> None:
+        """Rebuild the rows-by-path lookup used to route loaded previews."""
+        self._rows_by_path.clear()
+        for row, target in enumerate(self._targets):
+            self._rows_by_path.setdefault(str(target.path), []).append(row)
+
+    def reload_previews(self, rows: Iterable[int] | None = None) -> None:
+        """
+        Re-check preview files on disk; only changed ones are decoded again.
+
+        Args:
+            rows: Rows whose files may have changed, or None for all rows.
+        """
+        if rows is None:
+            self._preview_keys.clear()
+            if self._targets:
+                self.dataChanged.emit(
+                    self.index(0, self.COL_PREVIEW),
+                    self.index(len(self._targets) - 1, self.COL_PREVIEW),
+                    [Qt.ItemDataRole.DecorationRole]
+                )
+            return
+        for row in rows:
+            self._preview_keys.pop(str(self._targets[row].path), None)
+            index = self.index(row, self.COL_PREVIEW)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def _preview(self, path_str: str) -> QIcon | None:
+        """Get a cached preview, starting a background load on a miss."""
+        key = self._preview_keys.get(path_str)
+        if key is None:
+            try:
+                mtime_ns = os.stat(path_str).st_mtime_ns
+            except OSError:
+                mtime_ns = 0
+            key = self._preview_keys[path_str] = preview_cache_key(
+                "target-preview", path_str, mtime_ns, self.PREVIEW_SIZE
+            )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return QIcon(pixmap)
+        if key not in self._preview_tasks:
+            task = PreviewLoadTask(load_icon_preview_image, path_str, self.PREVIEW_SIZE, key)
+            task.signals.loaded.connect(self._on_preview_loaded)
+            self._preview_tasks[key] = task
+            QThreadPool.globalInstance().start(task)
+        return None
+
+    @pyqtSlot(str, str, QImage)
+    def _on_preview_loaded(self, key: str, path_str: str, image: QImage):
+        self._preview_tasks.pop(key, None)
+        QPixmapCache.insert(key, QPixmap.fromImage(image))
+        # A reload may have seen the file change while this was decoding
+        if self._preview_keys.get(path_str) != key:
+            return
+        for row in self._rows_by_path.get(path_str, ()):
+            index = self.index(row, self.COL_PREVIEW)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def target_changed(self, row: int) -> None:
+        """Repaint a row after its target was modified in place."""
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def is_checked(self, row: int) -> bool:
+        return self._checked[row]
+
+    def set_checked(self, row: int, checked: bool) -> None:
+        self.setData(
+            self.index(row, self.COL_CHECK),
+            Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked,
+            Qt.ItemDataRole.CheckStateRole
+        )
+
+    def check_where(self, predicate: Callable[[IconTarget], bool]) -> None:
+        """Check the targets matching predicate and uncheck the rest."""
+        self._checked = [bool(predicate(target)) for target in self._targets]
+        if self._targets:
+            self.dataChanged.emit(
+                self.index(0, self.COL_CHECK),
+                self.index(len(self._targets) - 1, self.COL_CHECK),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
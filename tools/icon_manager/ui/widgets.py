@@ -4,18 +4,22 @@ Reusable UI widgets for the Icon Manager.
 
 import subprocess
 import sys
+from collections import OrderedDict
+from dataclasses import astuple
 from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import QLabel, QGroupBox, QVBoxLayout, QHBoxLayout, QPushButton, QMenu
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QImage, QPainter, QAction
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache, QPainter, QAction
 from PyQt6.QtSvg import QSvgRenderer
 
 from ..core import COLORS, IconBounds, IconTarget
 from ..rendering import (
-    create_checkerboard,
-    get_svg_content_bounds,
+    cached_checkerboard,
+    load_svg_source,
+    prescale_fast,
+    preview_cache_key,
     render_svg_to_size,
     render_svg_cropped,
     render_png_to_bounds,
@@ -26,6 +30,18 @@ from .icons import get_icon
 class IconPreviewLabel(QLabel):
     """Label that displays an icon with checkerboard background."""
 
+    # Built once; _set_style() skips setStyleSheet() when already applied
+    _PLACEHOLDER_QSS = f"""
+        QLabel {{
+            background-color: {COLORS['surface_alt']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            color: {COLORS['text_disabled']};
+            font-size: 24px;
+        }}
+    """
+    _IMAGE_QSS = f"QLabel {{ border: 1px solid {COLORS['border']}; border-radius: 8px; }}"
+
     def __init__(self, size: int = 96, parent=None):
         super().__init__(parent)
         self.preview_size = size
@@ -58,15 +74,12 @@ class IconPreviewLabel(QLabel):
     def _set_placeholder(self):
         self.current_path = None
         self.setText("—")
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {COLORS['surface_alt']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                color: {COLORS['text_disabled']};
-                font-size: 24px;
-            }}
-        """)
+        self._set_style(self._PLACEHOLDER_QSS)
+
+    def _set_style(self, qss: str):
+        # Setting an identical stylesheet still re-polishes the widget
+        if self.styleSheet() != qss:
+            self.setStyleSheet(qss)
 
     def set_from_qimage(self, image: QImage, path: Optional[Path] = None, fill: bool = True):
         """Display a QImage on checkerboard background.
@@ -81,19 +94,20 @@ class IconPreviewLabel(QLabel):
             return
 
         self.current_path = path
-        bg = create_checkerboard(self.preview_size, self.preview_size, 8)
+        bg = cached_checkerboard(self.preview_size, self.preview_size, 8).copy()
+        aspect = Qt.AspectRatioMode.IgnoreAspectRatio if fill else Qt.AspectRatioMode.KeepAspectRatio
+
+        image = prescale_fast(image, self.preview_size, aspect)
 
         if fill:
             # Scale to fill the entire container (icons should be square)
             scaled = image.scaled(self.preview_size, self.preview_size,
-                                  Qt.AspectRatioMode.IgnoreAspectRatio,
-                                  Qt.TransformationMode.SmoothTransformation)
+                                  aspect, Qt.TransformationMode.SmoothTransformation)
             x, y = 0, 0
         else:
             # Scale while preserving aspect ratio
             scaled = image.scaled(self.preview_size, self.preview_size,
-                                  Qt.AspectRatioMode.KeepAspectRatio,
-                                  Qt.TransformationMode.SmoothTransformation)
+                                  aspect, Qt.TransformationMode.SmoothTransformation)
             x = (self.preview_size - scaled.width()) // 2
             y = (self.preview_size - scaled.height()) // 2
 
@@ -101,16 +115,35 @@ class IconPreviewLabel(QLabel):
         painter.drawImage(x, y, scaled)
         painter.end()
 
-        self.setPixmap(bg)
-        self.setStyleSheet(f"QLabel {{ border: 1px solid {COLORS['border']}; border-radius: 8px; }}")
+        self._show_pixmap(bg)
+
+    def _show_pixmap(self, pixmap: QPixmap):
+        self.setPixmap(pixmap)
+        self._set_style(self._IMAGE_QSS)
 
     def set_from_path(self, path: Path, fill: bool = True):
-        """Load and display an image from a file path."""
-        if not path.exists():
+        """
+        Load and display an image from a file path.
+
+        The finished preview is kept in QPixmapCache, keyed by file mtime,
+        so reselecting an unchanged file skips the decode and scale.
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
             self._set_placeholder()
             return
+        prefix = "label-preview-fill" if fill else "label-preview-fit"
+        key = preview_cache_key(prefix, path, mtime_ns, self.preview_size)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            self.current_path = path
+            self._show_pixmap(pixmap)
+            return
         image = QImage(str(path))
         self.set_from_qimage(image, path, fill=fill)
+        if not image.isNull():
+            QPixmapCache.insert(key, self.pixmap())
 
     def clear(self):
         """Clear the preview and show placeholder."""
@@ -120,11 +153,19 @@ class IconPreviewLabel(QLabel):
 class ComparisonWidget(QGroupBox):
     """Widget showing before/after icon comparison."""
 
+    # Rendered 'New' previews kept for switching back to recent targets
+    PREVIEW_CACHE_SIZE = 32
+
     def __init__(self, parent=None):
         super().__init__("Preview", parent)
         self.svg_renderer: Optional[QSvgRenderer] = None
         self.svg_bounds: Optional[IconBounds] = None
         self.current_target: Optional[IconTarget] = None
+        self._preview_cache: OrderedDict[tuple, QImage] = OrderedDict()
+        # Bumped by set_svg() so previews of the old default SVG miss
+        self._svg_version = 0
+        # Cropped default SVG preview, rendered once per set_svg()
+        self._default_preview: Optional[QImage] = None
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -173,13 +214,41 @@ class ComparisonWidget(QGroupBox):
         """Set the default SVG renderer and its content bounds."""
         self.svg_renderer = renderer
         self.svg_bounds = bounds
+        self._svg_version += 1
+        self._default_preview = None
         self._update_new_preview()
 
+    def _preview_key(self, target: IconTarget) -> Optional[tuple]:
+        """Everything a target's rendered preview depends on, or None if unknown."""
+        if target.override_path:
+            try:
+                source = (str(target.override_path), target.override_path.stat().st_mtime_ns)
+            except OSError:
+                return None
+        else:
+            source = ("", self._svg_version)
+        bounds = astuple(target.bounds) if target.bounds else None
+        return source, target.width, target.height, bounds
+
     def _render_preview_image(self, target: IconTarget) -> Optional[QImage]:
         """
         Render the preview image for a target using the exact same logic as generation.
         Returns None if no valid source is available.
         """
+        key = self._preview_key(target)
+        image = self._preview_cache.get(key) if key is not None else None
+        if image is not None:
+            self._preview_cache.move_to_end(key)
+            return image
+        image = self._render_source(target)
+        if image is not None and key is not None:
+            self._preview_cache[key] = image
+            if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+        return image
+
+    def _render_source(self, target: IconTarget) -> Optional[QImage]:
+        """Render a target from its override or the default SVG, uncached."""
         if target.override_is_png:
             source = QImage(str(target.override_path))
             if source.isNull():
@@ -188,10 +257,10 @@ class ComparisonWidget(QGroupBox):
 
         if target.override_path:
             # SVG override
-            renderer = QSvgRenderer(str(target.override_path))
-            if not renderer.isValid():
+            loaded = load_svg_source(target.override_path)
+            if loaded is None:
                 return None
-            svg_bounds = get_svg_content_bounds(renderer)
+            _, renderer, svg_bounds = loaded
             return render_svg_cropped(renderer, target, svg_bounds)
 
         if self.svg_renderer and self.svg_renderer.isValid():
@@ -201,10 +270,14 @@ class ComparisonWidget(QGroupBox):
         return None
 
     def _render_default_svg_preview(self) -> Optional[QImage]:
-        """Render a preview of the default SVG with cropping applied."""
+        """Render a preview of the default SVG with cropping applied, once per SVG."""
         if not self.svg_renderer or not self.svg_renderer.isValid():
             return None
-        return render_svg_to_size(self.svg_renderer, self.new_preview.preview_size, self.svg_bounds)
+        if self._default_preview is None:
+            self._default_preview = render_svg_to_size(
+                self.svg_renderer, self.new_preview.preview_size, self.svg_bounds
+            )
+        return self._default_preview
 
     def _update_new_preview(self):
         """Update the 'New/Override' preview to show what the generated output will look like."""
@@ -303,13 +376,14 @@ class SvgInputWidget(QGroupBox):
 
     def set_svg(self, path: Path) -> bool:
         """Load an SVG file and update the preview."""
-        renderer = QSvgRenderer(str(path))
-        if not renderer.isValid():
+        loaded = load_svg_source(path)
+        if loaded is None:
             return False
 
+        _, renderer, bounds = loaded
         self.svg_path = path
         self.svg_renderer = renderer
-        self.svg_bounds = get_svg_content_bounds(renderer)
+        self.svg_bounds = bounds
 
         # Render SVG to image for preview
         preview_image = render_svg_to_size(renderer, self.preview.preview_size, self.svg_bounds)
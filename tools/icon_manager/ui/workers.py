@@ -0,0 +1,210 @@
+"""
+Background workers for long-running icon operations.
+
+Workers run on the global QThreadPool and report back through Qt signals,
+which are delivered on the GUI thread via queued connections.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, pyqtSignal
+from PyQt6.QtGui import QImage, QImageWriter
+from PyQt6.QtSvg import QSvgRenderer
+
+from ..core import IconBounds, IconTarget, RenderHashCache
+from ..rendering import render_png_to_bounds, render_svg_cropped
+
+
+class ProgressSignals(QObject):
+    """Signals emitted by ProgressTask."""
+
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int, list)
+
+
+class ProgressTask(QRunnable):
+    """
+    Run a cancellable function that reports progress off the GUI thread.
+
+    The function must accept ``progress`` and ``is_cancelled`` keyword
+    arguments and return a (success_count, error_messages) tuple, like the
+    ``replace_layer*`` functions in core.adaptive_icons.
+    """
+
+    def __init__(self, func: Callable[..., tuple[int, list[str]]], *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = ProgressSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Ask the task to stop before its next target; safe from any thread."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self):
+        try:
+            success, errors = self.func(
+                *self.args,
+                progress=self.signals.progress.emit,
+                is_cancelled=self._cancelled.is_set,
+                **self.kwargs
+            )
+        except Exception as e:
+            success, errors = 0, [str(e)]
+        self.signals.finished.emit(success, errors)
+
+
+class PreviewLoadSignals(QObject):
+    """Signals emitted by PreviewLoadTask."""
+
+    # cache key, file path, loaded image
+    loaded = pyqtSignal(str, str, QImage)
+
+
+class PreviewLoadTask(QRunnable):
+    """
+    Load one preview image on the thread pool.
+
+    load(path_str, size) must only use QImage, never QPixmap. The result is
+    emitted with the caller's cache key, so the receiving slot can drop
+    results it no longer wants.
+    """
+
+    def __init__(self, load: Callable[[str, int], QImage], path_str: str, size: int, key: str):
+        super().__init__()
+        self.load = load
+        self.path_str = path_str
+        self.size = size
+        self.key = key
+        self.signals = PreviewLoadSignals()
+
+    def run(self):
+        self.signals.loaded.emit(self.key, self.path_str, self.load(self.path_str, self.size))
+
+
+class RenderTargetSignals(QObject):
+    """Signals emitted by RenderTargetTask."""
+
+    # job index, saved, error message ("" when saved or skipped),
+    # pixel digest ("" when not hashed)
+    finished = pyqtSignal(int, bool, str, str)
+
+
+def _pixel_digest(image: QImage) -> str:
+    """Hash an image's size, format and raw pixels."""
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.width()}x{image.height()}:{image.format().value}:".encode())
+    digest.update(bits)
+    return digest.hexdigest()
+
+
+def _write_png(image: QImage, path: Path) -> str:
+    """
+    Encode an image as PNG in memory, then replace path with it.
+
+    The encoded bytes go to a temporary file next to path in a single
+    write and are renamed over it, so an interrupted run never leaves a
+    truncated icon behind.
+
+    Returns:
+        An error message, or "" on success.
+    """
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    writer = QImageWriter(buffer, b"PNG")
+    ok = writer.write(image)
+    buffer.close()
+    if not ok:
+        return writer.errorString()
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data.data())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        return str(e)
+    return ""
+
+
+class RenderTargetTask(QRunnable):
+    """
+    Render one icon target from its SVG or PNG source and save it as PNG.
+
+    QSvgRenderer objects cannot be shared between threads, so each task
+    parses its own renderer from the SVG bytes. The SVG content bounds are
+    computed once by the caller and passed in.
+
+    With a hash cache, the rendered pixels are hashed and the save is
+    skipped when the file on disk is unchanged since it was written from
+    an identical render. The caller records new hashes on the GUI thread
+    and creates the destination directories beforehand.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        target: IconTarget,
+        dest_path: Path,
+        label: str,
+        svg_data: Optional[QByteArray],
+        svg_bounds: Optional[IconBounds],
+        cancelled: threading.Event,
+        hash_cache: Optional[RenderHashCache] = None
+    ):
+        super().__init__()
+        self.index = index
+        self.target = target
+        self.dest_path = dest_path
+        self.label = label
+        self.svg_data = svg_data
+        self.svg_bounds = svg_bounds
+        self.cancelled = cancelled
+        self.hash_cache = hash_cache
+        self.signals = RenderTargetSignals()
+
+    def run(self):
+        if self.cancelled.is_set():
+            self.signals.finished.emit(self.index, False, "", "")
+            return
+        try:
+            if self.target.override_is_png:
+                source = QImage(str(self.target.override_path))
+                image = render_png_to_bounds(source, self.target)
+            else:
+                renderer = QSvgRenderer(self.svg_data)
+                image = render_svg_cropped(renderer, self.target, self.svg_bounds)
+
+            digest = ""
+            if self.hash_cache is not None:
+                digest = _pixel_digest(image)
+                try:
+                    mtime_ns = self.dest_path.stat().st_mtime_ns
+                except OSError:
+                    mtime_ns = None
+                # Jobs for the same file run one at a time, so the entry
+                # read here is up to date
+                if mtime_ns is not None and self.hash_cache.get(self.dest_path, mtime_ns) == digest:
+                    self.signals.finished.emit(self.index, True, "", digest)
+                    return
+
+            error = _write_png(image, self.dest_path)
+            if not error:
+                self.signals.finished.emit(self.index, True, "", digest)
+            else:
+                self.signals.finished.emit(self.index, False, f"Failed to save: {self.label} ({error})", "")
+        except Exception as e:
+            self.signals.finished.emit(self.index, False, f"{self.label}: {e}", "")